@@ -55,9 +55,11 @@ download_jre() {
 # Build Java signer
 build_java() {
     JAR_PATH="$SCRIPT_DIR/java-signer/target/luxtrust-pdf-signer-1.0.0.jar"
+    JAVA_DIR="$SCRIPT_DIR/java-signer"
 
-    if [ -f "$JAR_PATH" ]; then
-        echo "Java JAR already built"
+    # Rebuild when the sources changed since the JAR was built
+    if [ -f "$JAR_PATH" ] && [ -z "$(find "$JAVA_DIR/src" "$JAVA_DIR/pom.xml" -newer "$JAR_PATH" -print -quit)" ]; then
+        echo "Java JAR up to date"
         return
     fi
 
@@ -2,6 +2,8 @@ package lu.pdfsign;
 
 import com.google.gson.Gson;
 import com.google.gson.GsonBuilder;
+import com.google.gson.JsonArray;
+import com.google.gson.JsonParser;
 import com.itextpdf.io.font.constants.StandardFonts;
 import com.itextpdf.io.image.ImageData;
 import com.itextpdf.io.image.ImageDataFactory;
@@ -16,6 +18,7 @@ import org.bouncycastle.jce.provider.BouncyCastleProvider;
 
 import java.io.*;
 import java.io.PrintWriter;
+import java.nio.charset.StandardCharsets;
 import java.security.*;
 import java.security.cert.Certificate;
 import java.security.cert.X509Certificate;
@@ -32,10 +35,16 @@ public class LuxTrustSigner {
         "/usr/lib/ClassicClient/libgclib.so",
         "/usr/lib/x86_64-linux-gnu/opensc-pkcs11.so"
     };
+    private static final int OUTPUT_BUFFER_SIZE = 1 << 20;
+    private static final int SERVER_PROTOCOL_VERSION = 1;
 
     private final Gson gson = new GsonBuilder().setPrettyPrinting().create();
     private Provider pkcs11Provider;
     private KeyStore keyStore;
+    // Identifies the logged-in session so server mode can reuse it
+    private String sessionLibPath;
+    private int sessionSlot = -1;
+    private byte[] sessionPinDigest;
 
     public static void main(String[] args) {
         Security.addProvider(new BouncyCastleProvider());
@@ -62,22 +71,18 @@ public class LuxTrustSigner {
                 return;
             }
 
-            if (cmd.hasOption("list-certs")) {
-                listCertificates(cmd);
+            if (cmd.hasOption("server")) {
+                serve(options, parser);
                 return;
             }
 
-            if (cmd.hasOption("sign")) {
-                signPdf(cmd);
-                return;
-            }
-
-            if (cmd.hasOption("list-tokens")) {
-                listTokens(cmd);
+            Map<String, Object> result = execute(cmd);
+            if (result == null) {
+                printHelp(options);
                 return;
             }
 
-            printHelp(options);
+            System.out.println(gson.toJson(result));
 
         } catch (ParseException e) {
             System.err.println("Error: " + e.getMessage());
@@ -86,6 +91,66 @@ public class LuxTrustSigner {
         }
     }
 
+    private Map<String, Object> execute(CommandLine cmd) throws Exception {
+        if (cmd.hasOption("list-certs")) {
+            return listCertificates(cmd);
+        }
+
+        if (cmd.hasOption("sign")) {
+            return signPdf(cmd);
+        }
+
+        if (cmd.hasOption("list-tokens")) {
+            return listTokens(cmd);
+        }
+
+        return null;
+    }
+
+    /**
+     * Serve commands read from stdin until EOF, keeping the JVM warm.
+     * Each request is one JSON line {"args": [...]} and gets exactly one
+     * compact JSON line in reply on stdout.
+     */
+    private void serve(Options options, CommandLineParser parser) throws IOException {
+        Gson compact = new Gson();
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        PrintStream out = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+
+        // Keep stray library output off the protocol channel
+        System.setOut(System.err);
+
+        out.println(toJson("ready", SERVER_PROTOCOL_VERSION));
+
+        String line;
+        while ((line = in.readLine()) != null) {
+            if (line.isBlank()) {
+                continue;
+            }
+
+            Map<String, Object> result;
+            try {
+                JsonArray jsonArgs = JsonParser.parseString(line).getAsJsonObject().getAsJsonArray("args");
+                String[] requestArgs = new String[jsonArgs.size()];
+                for (int i = 0; i < requestArgs.length; i++) {
+                    requestArgs[i] = jsonArgs.get(i).getAsString();
+                }
+
+                result = execute(parser.parse(options, requestArgs));
+                if (result == null) {
+                    throw new IllegalArgumentException("Commande inconnue");
+                }
+            } catch (Exception e) {
+                // The token may have been removed or the PIN changed: log in again next time
+                resetSession();
+                result = new LinkedHashMap<>();
+                result.put("error", e.getMessage() != null ? e.getMessage() : e.toString());
+            }
+
+            out.println(compact.toJson(result));
+        }
+    }
+
     private Options createOptions() {
         Options options = new Options();
 
@@ -94,6 +159,11 @@ public class LuxTrustSigner {
         options.addOption("c", "list-certs", false, "Lister les certificats");
         options.addOption("s", "sign", false, "Signer un PDF");
 
+        options.addOption(Option.builder()
+            .longOpt("server")
+            .desc("Mode serveur: commandes JSON sur stdin, une par ligne")
+            .build());
+
         options.addOption(Option.builder("p")
             .longOpt("pin")
             .hasArg()
@@ -195,6 +265,12 @@ public class LuxTrustSigner {
             .desc("Nom du signataire")
             .build());
 
+        options.addOption(Option.builder()
+            .longOpt("field")
+            .hasArg()
+            .desc("Nom du champ de signature")
+            .build());
+
         options.addOption(Option.builder()
             .longOpt("json")
             .desc("Sortie en JSON")
@@ -223,6 +299,16 @@ public class LuxTrustSigner {
     }
 
     private void initPkcs11(String libPath, int slot, char[] pin) throws Exception {
+        byte[] pinDigest = MessageDigest.getInstance("SHA-256")
+            .digest(new String(pin).getBytes(StandardCharsets.UTF_8));
+
+        // Reuse the logged-in keystore for repeated commands on the same token
+        if (keyStore != null && libPath.equals(sessionLibPath) && slot == sessionSlot
+                && MessageDigest.isEqual(pinDigest, sessionPinDigest)) {
+            return;
+        }
+        resetSession();
+
         // Create temp config file for PKCS11
         File configFile = File.createTempFile("pkcs11", ".cfg");
         configFile.deleteOnExit();
@@ -240,10 +326,16 @@ public class LuxTrustSigner {
             }
 
             pkcs11Provider = pkcs11Provider.configure(configFile.getAbsolutePath());
+            // Replace any provider left by a previous command in server mode
+            Security.removeProvider(pkcs11Provider.getName());
             Security.addProvider(pkcs11Provider);
 
-            keyStore = KeyStore.getInstance("PKCS11", pkcs11Provider);
-            keyStore.load(null, pin);
+            KeyStore loaded = KeyStore.getInstance("PKCS11", pkcs11Provider);
+            loaded.load(null, pin);
+            keyStore = loaded;
+            sessionLibPath = libPath;
+            sessionSlot = slot;
+            sessionPinDigest = pinDigest;
         } catch (Exception e) {
             Throwable cause = e.getCause();
             String causeMsg = cause != null ? " caused by " + cause.getClass().getName() + ": " + cause.getMessage() : "";
@@ -251,7 +343,24 @@ public class LuxTrustSigner {
         }
     }
 
-    private void listTokens(CommandLine cmd) throws Exception {
+    private void resetSession() {
+        // SunPKCS11 ignores CKR_USER_ALREADY_LOGGED_IN, so a token left logged in
+        // would accept any PIN on the next login: log out before dropping it
+        if (pkcs11Provider instanceof AuthProvider) {
+            try {
+                ((AuthProvider) pkcs11Provider).logout();
+            } catch (Exception e) {
+                System.err.println("PKCS11 logout error: " + e.getMessage());
+            }
+        }
+        pkcs11Provider = null;
+        keyStore = null;
+        sessionLibPath = null;
+        sessionSlot = -1;
+        sessionPinDigest = null;
+    }
+
+    private Map<String, Object> listTokens(CommandLine cmd) throws Exception {
         String libPath = findPkcs11Library(cmd);
 
         Map<String, Object> result = new LinkedHashMap<>();
@@ -280,10 +389,10 @@ public class LuxTrustSigner {
             result.put("slots", slots);
         }
 
-        System.out.println(gson.toJson(result));
+        return result;
     }
 
-    private void listCertificates(CommandLine cmd) throws Exception {
+    private Map<String, Object> listCertificates(CommandLine cmd) throws Exception {
         String libPath = findPkcs11Library(cmd);
         int slot = Integer.parseInt(cmd.getOptionValue("slot", "0"));
         String pin = cmd.getOptionValue("pin");
@@ -311,6 +420,8 @@ public class LuxTrustSigner {
                     X509Certificate x509 = (X509Certificate) cert;
                     certInfo.put("subject", x509.getSubjectX500Principal().getName());
                     certInfo.put("issuer", x509.getIssuerX500Principal().getName());
+                    certInfo.put("subjectCN", extractCN(x509.getSubjectX500Principal().getName()));
+                    certInfo.put("issuerCN", extractCN(x509.getIssuerX500Principal().getName()));
                     certInfo.put("serial", x509.getSerialNumber().toString(16));
                     certInfo.put("notBefore", x509.getNotBefore().toString());
                     certInfo.put("notAfter", x509.getNotAfter().toString());
@@ -333,10 +444,10 @@ public class LuxTrustSigner {
         result.put("certificates", certs);
         result.put("count", certs.size());
 
-        System.out.println(gson.toJson(result));
+        return result;
     }
 
-    private void signPdf(CommandLine cmd) throws Exception {
+    private Map<String, Object> signPdf(CommandLine cmd) throws Exception {
         // Validate required parameters
         String inputFile = cmd.getOptionValue("input");
         String outputFile = cmd.getOptionValue("output");
@@ -400,7 +511,7 @@ public class LuxTrustSigner {
 
         // Sign the PDF
         PdfReader reader = new PdfReader(inputFile);
-        FileOutputStream fos = new FileOutputStream(outputFile);
+        OutputStream fos = new BufferedOutputStream(new FileOutputStream(outputFile), OUTPUT_BUFFER_SIZE);
 
         PdfSigner signer = new PdfSigner(reader, fos, new StampingProperties().useAppendMode());
 
@@ -466,7 +577,7 @@ public class LuxTrustSigner {
         }
 
         // Unique field name to support multiple signatures on the same document
-        signer.setFieldName("Signature_" + System.currentTimeMillis());
+        signer.setFieldName(cmd.getOptionValue("field", "Signature_" + System.currentTimeMillis()));
 
         // Create signature
         IExternalSignature signature = new PrivateKeySignature(
@@ -474,8 +585,12 @@ public class LuxTrustSigner {
         );
         IExternalDigest digest = new BouncyCastleDigest();
 
-        signer.signDetached(digest, signature, chain, null, null, null, 0,
-            PdfSigner.CryptoStandard.CADES);
+        try {
+            signer.signDetached(digest, signature, chain, null, null, null, 0,
+                PdfSigner.CryptoStandard.CADES);
+        } finally {
+            fos.close();
+        }
 
         // Output result
         Map<String, Object> result = new LinkedHashMap<>();
@@ -485,7 +600,7 @@ public class LuxTrustSigner {
         result.put("certificate", alias);
         result.put("signer", x509.getSubjectX500Principal().getName());
 
-        System.out.println(gson.toJson(result));
+        return result;
     }
 
     private String extractCN(String dn) {
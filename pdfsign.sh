@@ -40,8 +40,13 @@ else
     echo "    Installez le middleware Gemalto pour utiliser les cartes LuxTrust"
 fi
 
-# Compiler le JAR si necessaire
-if [ ! -f "$JAR_FILE" ]; then
+# Compiler le JAR s'il manque ou si les sources sont plus recentes
+JAVA_DIR="$SCRIPT_DIR/java-signer"
+if [ -f "$JAR_FILE" ] && [ -z "$(find "$JAVA_DIR/src" "$JAVA_DIR/pom.xml" -newer "$JAR_FILE" -print -quit)" ]; then
+    echo -e "${GREEN}[OK]${NC} JAR trouve"
+elif [ -f "$JAR_FILE" ] && ! command -v mvn &> /dev/null; then
+    echo -e "${YELLOW}[ATTENTION]${NC} JAR plus ancien que les sources, Maven absent pour le recompiler"
+else
     echo
     echo "Compilation du signer Java..."
     if command -v mvn &> /dev/null; then
@@ -58,8 +63,6 @@ if [ ! -f "$JAR_FILE" ]; then
         echo -e "${RED}[ERREUR]${NC} Maven n'est pas installe (necessaire pour compiler)"
         exit 1
     fi
-else
-    echo -e "${GREEN}[OK]${NC} JAR trouve"
 fi
 
 # Verifier les dependances Python
@@ -1,14 +1,20 @@
 """PDF document wrapper using PyMuPDF."""
 
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import pymupdf
 
+if TYPE_CHECKING:
+    # Qt is imported lazily so headless callers never pay its startup cost
+    from PySide6.QtGui import QImage, QPixmap
+
 logger = logging.getLogger(__name__)
-from PySide6.QtGui import QImage, QPixmap
-from PySide6.QtCore import QByteArray
+
+_SIGNATURE_WIDGET = pymupdf.PDF_WIDGET_TYPE_SIGNATURE
 
 
 @dataclass
@@ -33,9 +39,32 @@ class SignatureInfo:
 class PDFDocument:
     """Wrapper around PyMuPDF for PDF operations."""
 
+    RENDER_CACHE_MAX_ENTRIES = 32
+    # High zoom pages are large (~50 MB at 4x for A4), so bound pixels too
+    RENDER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    BYTES_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    # Rasterizations between trims of the MuPDF store (fonts, images, decoded
+    # objects); TOOLS.store_size() is a stub returning None, so count renders
+    STORE_TRIM_INTERVAL = 32
+    DISPLAYLIST_CACHE_MAX_ENTRIES = 8
+    # Files up to this size are read into memory in one go before parsing; the
+    # buffer lives as long as the document, so larger files are opened by path
+    IN_MEMORY_OPEN_MAX_BYTES = 8 * 1024 * 1024
+
     def __init__(self):
         self._doc: pymupdf.Document | None = None
         self._path: Path | None = None
+        self._page_count = 0
+        self._render_cache: OrderedDict[tuple[int, float, bool], QPixmap] = OrderedDict()
+        self._render_cache_size = 0
+        self._bytes_cache: OrderedDict[tuple[int, float, str], bytes] = OrderedDict()
+        self._bytes_cache_size = 0
+        # Display lists are zoom-independent, so zooming a page skips re-interpreting it
+        self._displaylist_cache: OrderedDict[int, pymupdf.DisplayList] = OrderedDict()
+        self._signatures_cache: list[SignatureInfo] | None = None
+        self._has_signatures_cache: bool | None = None
+        self._page_info_cache: list[PageInfo] | None = None
+        self._renders_since_trim = 0
 
     @property
     def is_open(self) -> bool:
@@ -50,9 +79,7 @@ class PDFDocument:
     @property
     def page_count(self) -> int:
         """Get the number of pages in the document."""
-        if not self._doc:
-            return 0
-        return len(self._doc)
+        return self._page_count
 
     def open(self, file_path: str | Path) -> None:
         """
@@ -69,18 +96,62 @@ class PDFDocument:
         if not path.exists():
             raise FileNotFoundError(f"PDF file not found: {path}")
 
+        self.clear_render_cache()
+        self._signatures_cache = None
+        self._has_signatures_cache = None
+        self._page_info_cache = None
+        if self._doc:
+            # Previous document's resources are no longer needed
+            pymupdf.TOOLS.store_shrink(100)
+
         try:
-            self._doc = pymupdf.open(str(path))
+            if path.stat().st_size <= self.IN_MEMORY_OPEN_MAX_BYTES:
+                # One sequential read beats MuPDF's seek-heavy file access
+                # on slow or network filesystems.
+                self._doc = pymupdf.open(stream=path.read_bytes(), filetype="pdf")
+            else:
+                self._doc = pymupdf.open(str(path))
             self._path = path
+            self._page_count = len(self._doc)
         except Exception as e:
             raise RuntimeError(f"Failed to open PDF: {e}") from e
 
     def close(self) -> None:
         """Close the current document."""
+        self.clear_render_cache()
+        self._signatures_cache = None
+        self._has_signatures_cache = None
+        self._page_info_cache = None
         if self._doc:
             self._doc.close()
             self._doc = None
             self._path = None
+            self._page_count = 0
+            pymupdf.TOOLS.store_shrink(100)
+
+    def clear_render_cache(self) -> None:
+        """Drop all cached page renders."""
+        self._render_cache.clear()
+        self._render_cache_size = 0
+        self._bytes_cache.clear()
+        self._bytes_cache_size = 0
+        self._displaylist_cache.clear()
+
+    def trim_cache(self) -> None:
+        """
+        Release cached renders and empty the MuPDF store.
+
+        Intended for low-memory hosts; pages are re-rendered on demand.
+        """
+        self.clear_render_cache()
+        pymupdf.TOOLS.store_shrink(100)
+
+    def _trim_store_if_needed(self) -> None:
+        """Halve the MuPDF store every STORE_TRIM_INTERVAL rasterizations."""
+        self._renders_since_trim += 1
+        if self._renders_since_trim >= self.STORE_TRIM_INTERVAL:
+            self._renders_since_trim = 0
+            pymupdf.TOOLS.store_shrink(50)
 
     def get_page_info(self, page_num: int) -> PageInfo:
         """
@@ -98,9 +169,12 @@ class PDFDocument:
         if not self._doc:
             raise RuntimeError("No document is open")
 
-        if page_num < 0 or page_num >= len(self._doc):
+        if page_num < 0 or page_num >= self._page_count:
             raise ValueError(f"Invalid page number: {page_num}")
 
+        if self._page_info_cache is not None:
+            return self._page_info_cache[page_num]
+
         page = self._doc[page_num]
         rect = page.rect
 
@@ -111,12 +185,42 @@ class PDFDocument:
             rotation=page.rotation
         )
 
+    def get_all_page_info(self) -> list[PageInfo]:
+        """
+        Get information about every page in one pass.
+
+        The result is cached until the document is closed or replaced, and
+        also serves later get_page_info() calls.
+
+        Returns:
+            List of PageInfo, one per page in order.
+
+        Raises:
+            RuntimeError: If no document is open.
+        """
+        if not self._doc:
+            raise RuntimeError("No document is open")
+
+        if self._page_info_cache is None:
+            infos = []
+            for page_num, page in enumerate(self._doc):
+                rect = page.rect
+                infos.append(PageInfo(
+                    number=page_num,
+                    width=rect.width,
+                    height=rect.height,
+                    rotation=page.rotation
+                ))
+            self._page_info_cache = infos
+
+        return list(self._page_info_cache)
+
     def render_page(
         self,
         page_num: int,
         zoom: float = 1.0,
         alpha: bool = False
-    ) -> QPixmap:
+    ) -> "QPixmap":
         """
         Render a page to a QPixmap.
 
@@ -132,19 +236,69 @@ class PDFDocument:
             RuntimeError: If no document is open.
             ValueError: If page number is invalid.
         """
+        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QPixmap
+
         if not self._doc:
             raise RuntimeError("No document is open")
 
-        if page_num < 0 or page_num >= len(self._doc):
+        if page_num < 0 or page_num >= self._page_count:
             raise ValueError(f"Invalid page number: {page_num}")
 
-        page = self._doc[page_num]
+        key = (page_num, round(zoom, 3), bool(alpha))
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            return cached
+
+        img = self._rasterize(page_num, zoom, alpha)
+
+        # QPixmap.fromImage copies into its own backing store. The pixel
+        # format already states whether there is alpha, so skip Qt's
+        # full-image scan for opaque pixels.
+        pixmap = QPixmap.fromImage(img, Qt.ImageConversionFlag.NoOpaqueDetection)
+
+        self._store_pixmap(key, pixmap)
+        return pixmap
+
+    def is_rendered(self, page_num: int, zoom: float = 1.0, alpha: bool = False) -> bool:
+        """Check whether render_page would be served from the cache."""
+        return (page_num, round(zoom, 3), bool(alpha)) in self._render_cache
+
+    def _store_pixmap(self, key: tuple[int, float, bool], pixmap: "QPixmap") -> None:
+        """Insert a page render, evicting oldest entries over the count or size cap."""
+        self._render_cache[key] = pixmap
+        self._render_cache_size += self._pixmap_bytes(pixmap)
+        while len(self._render_cache) > 1 and (
+            len(self._render_cache) > self.RENDER_CACHE_MAX_ENTRIES
+            or self._render_cache_size > self.RENDER_CACHE_MAX_BYTES
+        ):
+            _, evicted = self._render_cache.popitem(last=False)
+            self._render_cache_size -= self._pixmap_bytes(evicted)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: "QPixmap") -> int:
+        """Approximate memory held by a pixmap."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def _rasterize(self, page_num: int, zoom: float, alpha: bool) -> "QImage":
+        """Rasterize a page to a QImage."""
+        from PySide6.QtGui import QImage
+
+        displaylist = self._displaylist_cache.get(page_num)
+        if displaylist is None:
+            displaylist = self._doc[page_num].get_displaylist()
+            self._displaylist_cache[page_num] = displaylist
+            if len(self._displaylist_cache) > self.DISPLAYLIST_CACHE_MAX_ENTRIES:
+                self._displaylist_cache.popitem(last=False)
+        else:
+            self._displaylist_cache.move_to_end(page_num)
 
         # Create transformation matrix for zoom
         mat = pymupdf.Matrix(zoom, zoom)
 
         # Render page to pixmap
-        pix = page.get_pixmap(matrix=mat, alpha=alpha)
+        pix = displaylist.get_pixmap(matrix=mat, alpha=alpha)
 
         # Convert to QImage
         if pix.alpha:
@@ -152,16 +306,20 @@ class PDFDocument:
         else:
             fmt = QImage.Format.Format_RGB888
 
+        # pix.samples is an owned bytes copy that the QImage keeps
+        # referenced, so no intermediate QImage.copy() is needed.
+        samples = pix.samples
         img = QImage(
-            pix.samples,
+            samples,
             pix.width,
             pix.height,
             pix.stride,
             fmt
         )
+        del pix
+        self._trim_store_if_needed()
 
-        # Must copy because pix.samples is temporary
-        return QPixmap.fromImage(img.copy())
+        return img
 
     def render_page_to_bytes(
         self,
@@ -183,11 +341,98 @@ class PDFDocument:
         if not self._doc:
             raise RuntimeError("No document is open")
 
+        key = (page_num, round(zoom, 3), image_format)
+        cached = self._bytes_cache.get(key)
+        if cached is not None:
+            self._bytes_cache.move_to_end(key)
+            return cached
+
         page = self._doc[page_num]
         mat = pymupdf.Matrix(zoom, zoom)
         pix = page.get_pixmap(matrix=mat)
+        data = pix.tobytes(image_format)
+        del pix
+        self._trim_store_if_needed()
+
+        self._store_bytes(key, data)
+        return data
+
+    def render_thumbnail(self, page_num: int, max_dim: int = 200) -> bytes:
+        """
+        Render a small grayscale JPEG preview of a page.
+
+        Args:
+            page_num: Page number (0-indexed).
+            max_dim: Size in pixels of the longest side of the thumbnail.
+
+        Returns:
+            JPEG image data as bytes.
+
+        Raises:
+            RuntimeError: If no document is open.
+            ValueError: If page number is invalid.
+        """
+        if not self._doc:
+            raise RuntimeError("No document is open")
+
+        if page_num < 0 or page_num >= self._page_count:
+            raise ValueError(f"Invalid page number: {page_num}")
+
+        page = self._doc[page_num]
+        rect = page.rect
+        zoom = max_dim / max(rect.width, rect.height)
+
+        key = (page_num, round(zoom, 3), "thumbnail")
+        cached = self._bytes_cache.get(key)
+        if cached is not None:
+            self._bytes_cache.move_to_end(key)
+            return cached
 
-        return pix.tobytes(image_format)
+        mat = pymupdf.Matrix(zoom, zoom)
+        pix = page.get_pixmap(matrix=mat, colorspace=pymupdf.csGRAY, alpha=False)
+        data = pix.tobytes("jpeg", jpg_quality=75)
+        del pix
+
+        self._store_bytes(key, data)
+        return data
+
+    def _store_bytes(self, key: tuple[int, float, str], data: bytes) -> None:
+        """Insert encoded page data, evicting oldest entries over the size cap."""
+        self._bytes_cache[key] = data
+        self._bytes_cache_size += len(data)
+        while self._bytes_cache_size > self.BYTES_CACHE_MAX_BYTES and len(self._bytes_cache) > 1:
+            _, evicted = self._bytes_cache.popitem(last=False)
+            self._bytes_cache_size -= len(evicted)
+
+    def render_pages_to_bytes(
+        self,
+        page_nums: list[int],
+        zoom: float = 1.0,
+        image_format: str = "png"
+    ) -> list[bytes]:
+        """
+        Render several pages to bytes, e.g. for a thumbnail strip.
+
+        Pages go through render_page_to_bytes one by one, so each shares its
+        cache and repeated batches are served from memory.
+
+        Args:
+            page_nums: Page numbers (0-indexed).
+            zoom: Zoom factor.
+            image_format: Output format ("png" or "jpeg").
+
+        Returns:
+            Image data for each requested page, in order.
+        """
+        if not self._doc:
+            raise RuntimeError("No document is open")
+
+        page_count = self._page_count
+        for page_num in page_nums:
+            if page_num < 0 or page_num >= page_count:
+                raise ValueError(f"Invalid page number: {page_num}")
+
+        return [self.render_page_to_bytes(n, zoom, image_format) for n in page_nums]
 
     def get_page_text(self, page_num: int) -> str:
         """
@@ -209,54 +454,110 @@ class PDFDocument:
         """
         Get information about existing digital signatures in the document.
 
+        The result is computed once per opened document and cached.
+
         Returns:
             List of SignatureInfo objects for each signature found.
         """
         if not self._doc:
             return []
 
-        signatures = []
+        if self._signatures_cache is None and not self._doc.is_form_pdf:
+            # No AcroForm means no signature fields: skip the page walk
+            self._signatures_cache = []
 
-        for page_num in range(len(self._doc)):
-            page = self._doc[page_num]
+        if self._signatures_cache is None:
+            # PyMuPDF documents must not be shared across threads, so pages
+            # are scanned sequentially and the result memoized instead.
+            signatures = []
+            scan_page = self._scan_page_signatures
+            for page_num in range(self._page_count):
+                signatures.extend(scan_page(page_num))
+            self._signatures_cache = signatures
 
-            # Get all widgets (form fields) on the page
-            for widget in page.widgets():
-                if widget.field_type == pymupdf.PDF_WIDGET_TYPE_SIGNATURE:
-                    # Extract signature information
-                    field_name = widget.field_name or "Unknown"
-                    signer = ""
-                    signed_on = ""
+        return list(self._signatures_cache)
 
+    def get_field_names(self) -> set[str]:
+        """
+        Get the names of all form fields in the document, of any type.
+
+        Returns:
+            Set of field names.
+        """
+        if not self._doc or not self._doc.is_form_pdf:
+            return set()
+
+        doc = self._doc
+        return {
+            widget.field_name
+            for page_num in range(self._page_count)
+            for widget in doc[page_num].widgets()
+            if widget.field_name
+        }
+
+    def _scan_page_signatures(self, page_num: int) -> list[SignatureInfo]:
+        """Collect the signature fields present on a single page."""
+        page = self._doc[page_num]
+        signatures = []
+
+        # Get all widgets (form fields) on the page
+        for widget in page.widgets():
+            if widget.field_type == _SIGNATURE_WIDGET:
+                # Extract signature information
+                field_name = widget.field_name or "Unknown"
+                signer = ""
+                signed_on = ""
+
+                try:
+                    sig_value = widget.field_value
+                    if sig_value and isinstance(sig_value, dict):
+                        signer = sig_value.get("Name", "")
+                        signed_on = sig_value.get("M", "")
+                except Exception:
+                    logger.debug("Could not read signature value for field %s", field_name)
+
+                if not signer:
                     try:
-                        sig_value = widget.field_value
-                        if sig_value and isinstance(sig_value, dict):
-                            signer = sig_value.get("Name", "")
-                            signed_on = sig_value.get("M", "")
+                        display = widget.field_display or ""
+                        if display:
+                            signer = display
                     except Exception:
-                        logger.debug("Could not read signature value for field %s", field_name)
-
-                    if not signer:
-                        try:
-                            display = widget.field_display or ""
-                            if display:
-                                signer = display
-                        except Exception:
-                            logger.debug("Could not read display for field %s", field_name)
-
-                    signatures.append(SignatureInfo(
-                        field_name=field_name,
-                        page=page_num + 1,  # 1-indexed for display
-                        signer=signer if signer else "Signature numérique",
-                        signed_on=signed_on,
-                        is_valid=None,  # PyMuPDF doesn't validate signatures
-                    ))
+                        logger.debug("Could not read display for field %s", field_name)
+
+                signatures.append(SignatureInfo(
+                    field_name=field_name,
+                    page=page_num + 1,  # 1-indexed for display
+                    signer=signer if signer else "Signature numérique",
+                    signed_on=signed_on,
+                    is_valid=None,  # PyMuPDF doesn't validate signatures
+                ))
 
         return signatures
 
     def has_signatures(self) -> bool:
         """Check if the document contains any digital signatures."""
-        return len(self.get_signatures()) > 0
+        if not self._doc:
+            return False
+
+        if self._signatures_cache is not None:
+            return bool(self._signatures_cache)
+
+        if self._has_signatures_cache is None:
+            self._has_signatures_cache = self._find_signature_widget()
+        return self._has_signatures_cache
+
+    def _find_signature_widget(self) -> bool:
+        """Scan pages until the first signature widget is found."""
+        if not self._doc.is_form_pdf:
+            return False
+
+        # Stop at the first signature widget instead of building the full list
+        doc = self._doc
+        for page_num in range(self._page_count):
+            for widget in doc[page_num].widgets():
+                if widget.field_type == _SIGNATURE_WIDGET:
+                    return True
+        return False
 
     def __enter__(self):
         return self
@@ -1,11 +1,18 @@
 """PDF signature manager using Java/Gemalto backend."""
 
+import logging
+import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 
-from pdfsign.crypto.java_signer import JavaSigner, JavaSignerError, CertificateInfo
+from pdfsign.crypto.java_signer import JavaSigner, JavaSignerError, CertificateInfo, get_shared_signer
+
+logger = logging.getLogger(__name__)
+
+# Field names produced by generate_unique_field_name, e.g. "Signature3"
+_FIELD_NAME_RE = re.compile(r"^Signature(\d+)$")
 
 
 class SignatureAppearanceType(Enum):
@@ -15,7 +22,7 @@ class SignatureAppearanceType(Enum):
     TEXT_AND_IMAGE = auto()
 
 
-@dataclass
+@dataclass(frozen=True)
 class SignatureAppearance:
     """Configuration for signature visual appearance."""
     type: SignatureAppearanceType = SignatureAppearanceType.TEXT
@@ -55,6 +62,10 @@ class SignatureManager:
     the Gemalto PKCS#11 middleware for LuxTrust smart cards.
     """
 
+    # Per resolved path: (mtime_ns, size, last field number handed out), to
+    # avoid re-scanning; only the latest version of each file is kept
+    _field_counters: dict[Path, tuple[int, int, int]] = {}
+
     def __init__(self, pkcs11_lib: str | None = None):
         """
         Initialize the signature manager.
@@ -75,12 +86,28 @@ class SignatureManager:
         """Get or create the Java signer instance."""
         if self._java_signer is None:
             try:
-                self._java_signer = JavaSigner(pkcs11_lib=self._pkcs11_lib)
+                self._java_signer = get_shared_signer(self._pkcs11_lib)
             except JavaSignerError as e:
                 self._last_error = str(e)
                 raise
         return self._java_signer
 
+    @classmethod
+    def warm_up(cls, pkcs11_lib: str | None = None) -> None:
+        """
+        Create the shared Java signer and warm up the JVM.
+
+        Meant to run on a background thread at application start so the
+        first signature does not pay the JVM cold-start cost.
+
+        Args:
+            pkcs11_lib: Path to PKCS#11 library (auto-detected if None).
+        """
+        try:
+            get_shared_signer(pkcs11_lib).warm_up()
+        except JavaSignerError as e:
+            logger.debug("Java signer warm-up skipped: %s", e)
+
     def list_certificates(self, pin: str, slot: int = 0) -> list[CertificateInfo]:
         """
         List certificates on the token.
@@ -131,38 +158,81 @@ class SignatureManager:
         if config is None:
             config = SignatureConfig()
 
+        input_path = input_path if isinstance(input_path, Path) else Path(input_path)
+        output_path = output_path if isinstance(output_path, Path) else Path(output_path)
+        appearance = config.appearance
+        position = config.position
+
         try:
             signer = self._get_signer()
 
             result = signer.sign_pdf(
-                input_path=Path(input_path),
-                output_path=Path(output_path),
+                input_path=input_path,
+                output_path=output_path,
                 pin=pin,
                 alias=alias,
                 slot=slot,
-                reason=config.appearance.reason,
-                location=config.appearance.location,
-                contact=config.appearance.contact,
-                name=config.appearance.name,
-                image_path=str(config.appearance.image_path) if config.appearance.image_path else None,
+                reason=appearance.reason,
+                location=appearance.location,
+                contact=appearance.contact,
+                name=appearance.name,
+                image_path=str(appearance.image_path) if appearance.image_path else None,
                 visible=config.visible,
-                page=config.position.page,
-                x=config.position.x,
-                y=config.position.y,
-                width=config.position.width,
-                height=config.position.height,
+                page=position.page,
+                x=position.x,
+                y=position.y,
+                width=position.width,
+                height=position.height,
+                field_name=self.generate_unique_field_name(input_path),
             )
 
             if not result.success:
                 self._last_error = result.error or "Signing failed"
                 raise RuntimeError(self._last_error)
 
-            return Path(output_path)
+            return output_path
 
         except JavaSignerError as e:
             self._last_error = str(e)
             raise RuntimeError(f"Signing failed: {e}") from e
 
+    def sign_pdf_batch(
+        self,
+        jobs: list[tuple[Path, Path]],
+        pin: str,
+        config: SignatureConfig | None = None,
+        alias: str | None = None,
+        slot: int = 0,
+    ) -> list[Path]:
+        """
+        Sign several PDF documents with the same configuration.
+
+        Documents are signed one after another through the shared Java
+        signer, so the JVM is started once for the whole batch. The token
+        signs one request at a time, and stopping at the first failure
+        avoids repeating a wrong PIN against the card.
+
+        Args:
+            jobs: (input_path, output_path) pairs.
+            pin: User PIN.
+            config: Signature configuration applied to every document.
+            alias: Certificate alias (auto-detected if None).
+            slot: PKCS#11 slot number.
+
+        Returns:
+            Paths to the signed PDFs, in job order.
+
+        Raises:
+            RuntimeError: If signing any document fails.
+        """
+        if config is None:
+            config = SignatureConfig()
+
+        return [
+            self.sign_pdf(input_path, output_path, pin, config, alias, slot)
+            for input_path, output_path in jobs
+        ]
+
     def sign_pdf_simple(
         self,
         input_path: Path,
@@ -230,10 +300,42 @@ class SignatureManager:
         """
         Generate a unique signature field name.
 
+        The document's form fields are scanned once; later calls for the
+        same unmodified file continue from an in-memory counter.
+
         Args:
             pdf_path: Path to PDF to check for existing fields.
 
         Returns:
             Unique field name like "Signature1", "Signature2", etc.
         """
-        return f"Signature_{int(time.time())}"
+        path = Path(pdf_path).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return f"Signature_{int(time.time())}"
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = SignatureManager._field_counters.get(path)
+
+        if entry is not None and entry[:2] == version:
+            counter = entry[2]
+        else:
+            # Imported here so that importing this module does not load PyMuPDF
+            from pdfsign.core.pdf_document import PDFDocument
+
+            try:
+                with PDFDocument() as document:
+                    document.open(path)
+                    names = document.get_field_names()
+            except (FileNotFoundError, RuntimeError):
+                return f"Signature_{int(time.time())}"
+
+            counter = max(
+                (int(m.group(1)) for n in names if (m := _FIELD_NAME_RE.match(n))),
+                default=0,
+            )
+
+        counter += 1
+        SignatureManager._field_counters[path] = (*version, counter)
+        return f"Signature{counter}"
@@ -1,12 +1,19 @@
 """Java-based PDF signer using LuxTrust/Gemalto PKCS#11."""
 
+import atexit
 import json
+import logging
 import os
 import subprocess
 import shutil
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
+from pdfsign.utils.platform import discover_pkcs11_library
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CertificateInfo:
@@ -19,6 +26,8 @@ class CertificateInfo:
     not_after: str
     has_private_key: bool
     can_sign: bool
+    subject_cn: str = ""
+    issuer_cn: str = ""
 
 
 @dataclass
@@ -43,9 +52,14 @@ class JavaSigner:
 
     This class wraps the Java-based signer tool to provide
     PDF signing capabilities with LuxTrust smart cards.
+
+    Commands are sent to a long-lived JVM started with ``--server`` so the
+    JVM startup cost is paid once. JARs without server mode fall back to
+    one JVM per command.
     """
 
     COMMAND_TIMEOUT_SECONDS = 60
+    SERVER_PROTOCOL_VERSION = 1
 
     DEFAULT_JAR_PATHS = [
         Path(__file__).parent.parent.parent / "java-signer" / "target" / "luxtrust-pdf-signer-1.0.0.jar",
@@ -53,12 +67,6 @@ class JavaSigner:
         Path("/opt/luxtrust-signer/luxtrust-pdf-signer-1.0.0.jar"),
     ]
 
-    DEFAULT_PKCS11_PATHS = [
-        "/usr/lib/pkcs11/libgclib.so",
-        "/usr/lib/ClassicClient/libgclib.so",
-        "/usr/lib/x86_64-linux-gnu/opensc-pkcs11.so",
-    ]
-
     def __init__(
         self,
         jar_path: Path | None = None,
@@ -80,6 +88,19 @@ class JavaSigner:
         if not self._jar_path or not self._jar_path.exists():
             raise JavaSignerError(f"JAR not found: {self._jar_path}")
 
+        # Fixed parts of every command line, built once
+        self._base_cmd = [self._java_cmd, "-jar", str(self._jar_path)]
+        self._lib_args = ["--lib", self._pkcs11_lib] if self._pkcs11_lib else []
+
+        self._server: subprocess.Popen | None = None
+        self._server_supported = True
+        self._server_lock = threading.Lock()
+
+    @property
+    def pkcs11_lib(self) -> str | None:
+        """Get the PKCS#11 library passed to the Java signer."""
+        return self._pkcs11_lib
+
     def _find_jar(self) -> Path | None:
         """Find the signer JAR file."""
         env_path = os.environ.get("PDFSIGN_JAR_PATH")
@@ -91,14 +112,9 @@ class JavaSigner:
         return None
 
     def _find_pkcs11_lib(self) -> str | None:
-        """Find the PKCS#11 library."""
-        env_path = os.environ.get("PDFSIGN_PKCS11_LIB")
-        if env_path and Path(env_path).exists():
-            return env_path
-        for path in self.DEFAULT_PKCS11_PATHS:
-            if Path(path).exists():
-                return path
-        return None
+        """Find the PKCS#11 library, the same way PKCS11Manager does."""
+        path = discover_pkcs11_library()
+        return str(path) if path else None
 
     def _find_java(self, java_home: str | None) -> str:
         """Find the Java executable."""
@@ -116,27 +132,35 @@ class JavaSigner:
 
     def _run_command(self, args: list) -> dict:
         """Run a Java command and return JSON result."""
-        cmd = [self._java_cmd, "-jar", str(self._jar_path)] + args
+        args = args + self._lib_args
+
+        if self._server_supported:
+            with self._server_lock:
+                server = self._ensure_server()
+                if server is not None:
+                    return self._server_request(server, args)
+
+        return self._run_process(args)
 
-        if self._pkcs11_lib:
-            cmd.extend(["--lib", self._pkcs11_lib])
+    def _run_process(self, args: list) -> dict:
+        """Run a command in a fresh JVM and return JSON result."""
+        cmd = self._base_cmd + args
 
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=self.COMMAND_TIMEOUT_SECONDS,
             )
 
-            # Parse JSON output
+            # Parse JSON output straight from bytes; json decodes UTF-8 itself
             output = result.stdout.strip()
             if output:
                 return json.loads(output)
 
             if result.returncode != 0:
-                error = result.stderr.strip() or "Unknown error"
-                raise JavaSignerError(error)
+                error = result.stderr.strip()
+                raise JavaSignerError(error.decode(errors="replace") if error else "Unknown error")
 
             return {}
 
@@ -145,13 +169,146 @@ class JavaSigner:
         except json.JSONDecodeError as e:
             raise JavaSignerError(f"Invalid JSON response: {e}")
 
-    def list_certificates(self, pin: str, slot: int = 0) -> list[CertificateInfo]:
+    def _ensure_server(self) -> subprocess.Popen | None:
+        """
+        Return the running server JVM, starting it if needed.
+
+        Must be called with the server lock held. Returns None and disables
+        server mode if the JAR does not support it.
+        """
+        if self._server is not None and self._server.poll() is None:
+            return self._server
+
+        try:
+            server = subprocess.Popen(
+                self._base_cmd + ["--server"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning("Could not start Java signer server, using one JVM per command: %s", e)
+            self._server_supported = False
+            return None
+
+        # A JAR with server mode announces itself; older ones print usage and exit
+        line, _ = self._read_line(server)
+        try:
+            ready = json.loads(line).get("ready") == self.SERVER_PROTOCOL_VERSION
+        except (json.JSONDecodeError, AttributeError):
+            ready = False
+
+        if not ready:
+            logger.warning(
+                "Java signer JAR %s has no --server mode (stale build?); "
+                "using one JVM per command", self._jar_path
+            )
+            self._server_supported = False
+            server.kill()
+            server.wait()
+            return None
+
+        self._server = server
+        return server
+
+    def _server_request(self, server: subprocess.Popen, args: list) -> dict:
+        """Send one command to the server JVM and return its JSON reply."""
+        try:
+            server.stdin.write(json.dumps({"args": args}).encode() + b"\n")
+            server.stdin.flush()
+        except OSError as e:
+            self._stop_server()
+            raise JavaSignerError(f"Java signer unavailable: {e}")
+
+        line, timed_out = self._read_line(server)
+        if not line:
+            self._stop_server()
+            if timed_out:
+                raise JavaSignerError("Command timed out")
+            raise JavaSignerError("Java signer exited unexpectedly")
+
+        try:
+            result = json.loads(line)
+        except json.JSONDecodeError as e:
+            self._stop_server()
+            raise JavaSignerError(f"Invalid JSON response: {e}")
+
+        if "error" in result:
+            raise JavaSignerError(result["error"])
+        return result
+
+    def _read_line(self, server: subprocess.Popen) -> tuple[bytes, bool]:
+        """Read one stdout line, killing the server if it takes too long."""
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            server.kill()
+
+        timer = threading.Timer(self.COMMAND_TIMEOUT_SECONDS, _kill)
+        timer.start()
+        try:
+            line = server.stdout.readline()
+        finally:
+            timer.cancel()
+        return line, timed_out.is_set()
+
+    def _stop_server(self) -> None:
+        """Terminate the server JVM; the next command restarts it."""
+        if self._server is not None:
+            self._server.kill()
+            self._server.wait()
+            self._server = None
+
+    def close(self) -> None:
+        """Shut down the server JVM, if running."""
+        with self._server_lock:
+            if self._server is not None:
+                self._server.stdin.close()
+                try:
+                    self._server.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._server.kill()
+                self._server = None
+
+    def warm_up(self) -> None:
+        """
+        Start the JVM ahead of the first command.
+
+        With server mode the JVM then stays up for later commands.
+        Otherwise a throwaway invocation loads the JVM and signer JAR into
+        the OS page cache so the first real command starts faster.
+        """
+        if self._server_supported:
+            with self._server_lock:
+                self._ensure_server()
+            # Either the server is up or its failed probe already loaded the JVM
+            return
+
+        try:
+            subprocess.run(
+                self._base_cmd + ["--help"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=self.COMMAND_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    def list_certificates(
+        self,
+        pin: str,
+        slot: int = 0,
+        signing_only: bool = False,
+    ) -> list[CertificateInfo]:
         """
         List certificates on the token.
 
         Args:
             pin: User PIN for the token.
             slot: PKCS#11 slot number.
+            signing_only: Only return certificates with a private key and a
+                digitalSignature or nonRepudiation key usage.
 
         Returns:
             List of CertificateInfo objects.
@@ -164,6 +321,11 @@ class JavaSigner:
 
         certs = []
         for cert_data in result.get("certificates", []):
+            can_sign = cert_data.get("digitalSignature", False) or cert_data.get("nonRepudiation", False)
+            has_private_key = cert_data.get("hasPrivateKey", False)
+            if signing_only and not (can_sign and has_private_key):
+                continue
+
             certs.append(CertificateInfo(
                 alias=cert_data.get("alias", ""),
                 subject=cert_data.get("subject", ""),
@@ -171,8 +333,10 @@ class JavaSigner:
                 serial=cert_data.get("serial", ""),
                 not_before=cert_data.get("notBefore", ""),
                 not_after=cert_data.get("notAfter", ""),
-                has_private_key=cert_data.get("hasPrivateKey", False),
-                can_sign=cert_data.get("digitalSignature", False) or cert_data.get("nonRepudiation", False),
+                has_private_key=has_private_key,
+                can_sign=can_sign,
+                subject_cn=cert_data.get("subjectCN", ""),
+                issuer_cn=cert_data.get("issuerCN", ""),
             ))
 
         return certs
@@ -195,6 +359,7 @@ class JavaSigner:
         y: float = 50,
         width: float = 200,
         height: float = 50,
+        field_name: str | None = None,
     ) -> SignatureResult:
         """
         Sign a PDF document.
@@ -214,58 +379,94 @@ class JavaSigner:
             page: Page number for visible signature.
             x, y: Position of visible signature.
             width, height: Size of visible signature.
+            field_name: Signature field name (timestamp-based if None).
 
         Returns:
             SignatureResult with operation status.
         """
-        args = [
-            "--sign",
-            "--input", str(input_path),
-            "--output", str(output_path),
-            "--pin", pin,
-            "--slot", str(slot),
-        ]
-
-        if alias:
-            args.extend(["--alias", alias])
-        if reason:
-            args.extend(["--reason", reason])
-        if location:
-            args.extend(["--location", location])
-        if contact:
-            args.extend(["--contact", contact])
-        if name:
-            args.extend(["--name", name])
-        if image_path and Path(image_path).exists():
-            args.extend(["--image", str(image_path)])
-
-        if visible:
-            args.append("--visible")
-            args.extend(["--page", str(page)])
-            args.extend(["--x", str(x)])
-            args.extend(["--y", str(y)])
-            args.extend(["--width", str(width)])
-            args.extend(["--height", str(height)])
+        args = self._sign_args(
+            input_path, output_path, pin, alias, slot, reason, location, contact,
+            name, image_path, visible, page, x, y, width, height, field_name,
+        )
 
         try:
             result = self._run_command(args)
-
-            return SignatureResult(
-                success=result.get("success", False),
-                input_file=result.get("input", str(input_path)),
-                output_file=result.get("output", str(output_path)),
-                certificate=result.get("certificate", ""),
-                signer=result.get("signer", ""),
-            )
         except JavaSignerError as e:
-            return SignatureResult(
-                success=False,
-                input_file=str(input_path),
-                output_file=str(output_path),
-                certificate="",
-                signer="",
-                error=str(e),
-            )
+            return self._sign_failure(input_path, output_path, e)
+        return self._sign_success(input_path, output_path, result)
+
+    @staticmethod
+    def _sign_args(
+        input_path: Path,
+        output_path: Path,
+        pin: str,
+        alias: str | None,
+        slot: int,
+        reason: str,
+        location: str,
+        contact: str,
+        name: str,
+        image_path: str | None,
+        visible: bool,
+        page: int,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        field_name: str | None,
+    ) -> list:
+        """Build the signer arguments for a --sign command."""
+        options = (
+            ("--input", str(input_path)),
+            ("--output", str(output_path)),
+            ("--pin", pin),
+            ("--slot", str(slot)),
+            ("--alias", alias or None),
+            ("--reason", reason or None),
+            ("--location", location or None),
+            ("--contact", contact or None),
+            ("--name", name or None),
+            ("--image", str(image_path) if image_path and Path(image_path).exists() else None),
+            ("--field", field_name or None),
+        )
+        args = ["--sign"]
+        for flag, value in options:
+            if value is not None:
+                args.extend([flag, value])
+
+        if visible:
+            args += [
+                "--visible",
+                "--page", str(page),
+                "--x", str(x),
+                "--y", str(y),
+                "--width", str(width),
+                "--height", str(height),
+            ]
+        return args
+
+    @staticmethod
+    def _sign_success(input_path: Path, output_path: Path, result: dict) -> SignatureResult:
+        """Build a SignatureResult from the signer's JSON reply."""
+        return SignatureResult(
+            success=result.get("success", False),
+            input_file=result.get("input", str(input_path)),
+            output_file=result.get("output", str(output_path)),
+            certificate=result.get("certificate", ""),
+            signer=result.get("signer", ""),
+        )
+
+    @staticmethod
+    def _sign_failure(input_path: Path, output_path: Path, error: JavaSignerError) -> SignatureResult:
+        """Build a failed SignatureResult for a signer error."""
+        return SignatureResult(
+            success=False,
+            input_file=str(input_path),
+            output_file=str(output_path),
+            certificate="",
+            signer="",
+            error=str(error),
+        )
 
     def test_connection(self, pin: str, slot: int = 0) -> bool:
         """
@@ -283,3 +484,48 @@ class JavaSigner:
             return len(certs) > 0
         except JavaSignerError:
             return False
+
+
+# Signers shared by the whole process, keyed by resolved PKCS#11 library path
+_shared_signers: dict[str | None, JavaSigner] = {}
+_shared_signers_lock = threading.Lock()
+
+
+def get_shared_signer(pkcs11_lib: str | None = None) -> JavaSigner:
+    """
+    Get the process-wide Java signer for a PKCS#11 library.
+
+    Args:
+        pkcs11_lib: Path to PKCS#11 library (auto-detected if None).
+
+    Returns:
+        JavaSigner shared by all callers using the same library.
+
+    Raises:
+        JavaSignerError: If the signer cannot be created.
+    """
+    if pkcs11_lib is None:
+        discovered = discover_pkcs11_library()
+        pkcs11_lib = str(discovered) if discovered else None
+    # Explicit and auto-detected paths to one library must share one JVM
+    key = str(Path(pkcs11_lib).resolve()) if pkcs11_lib else None
+
+    with _shared_signers_lock:
+        signer = _shared_signers.get(key)
+        if signer is None:
+            signer = JavaSigner(pkcs11_lib=key)
+            _shared_signers[key] = signer
+        return signer
+
+
+def close_shared_signers() -> None:
+    """Shut down the shared signers, logging their server JVMs out of the token."""
+    with _shared_signers_lock:
+        signers = list(_shared_signers.values())
+        _shared_signers.clear()
+    for signer in signers:
+        signer.close()
+
+
+# The server JVMs hold a logged-in token session; end it when the app exits
+atexit.register(close_shared_signers)
@@ -1,13 +1,27 @@
 """PKCS#11 token management using Java backend."""
 
+import hashlib
+import hmac
+import re
+import secrets
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
 from pdfsign.utils.platform import discover_pkcs11_library, validate_pkcs11_library
-from pdfsign.crypto.java_signer import JavaSigner, JavaSignerError, CertificateInfo as JavaCertInfo
+from pdfsign.crypto.java_signer import (
+    JavaSigner, JavaSignerError, CertificateInfo as JavaCertInfo, get_shared_signer,
+)
 
+# Per-process key for PIN digests used as cache keys; a plain hash of a
+# short numeric PIN could be reversed by trying every PIN
+_PIN_DIGEST_KEY = secrets.token_bytes(32)
 
-@dataclass
+# Common Name RDN within a distinguished name, e.g. "CN=Jean Dupont,O=..."
+_CN_RE = re.compile(r"(?i)(?:^|,)\s*CN=([^,]+)")
+
+
+@dataclass(frozen=True, slots=True)
 class TokenInfo:
     """Information about a PKCS#11 token."""
     slot_id: int
@@ -17,7 +31,19 @@ class TokenInfo:
     serial: str
 
 
-@dataclass
+# LuxTrust cards use slot 0; the Java signer checks the card is present when listing certs
+_DEFAULT_TOKENS = (
+    TokenInfo(
+        slot_id=0,
+        label="LuxTrust",
+        manufacturer="Thales DIS",
+        model="Smart Card",
+        serial="",
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class CertificateInfo:
     """Information about a certificate on the token."""
     label: str
@@ -42,6 +68,13 @@ class PKCS11Manager:
     Uses Java backend with Gemalto PKCS#11 for LuxTrust cards.
     """
 
+    CERT_CACHE_TTL_SECONDS = 30.0
+
+    # Library found by auto-discovery, shared by all managers
+    _discovered_lib: Path | None = None
+    # Explicit library paths that already passed validation, resolved
+    _validated_libs: set[Path] = set()
+
     def __init__(self, lib_path: Path | str | None = None):
         """
         Initialize the PKCS#11 manager.
@@ -49,30 +82,69 @@ class PKCS11Manager:
         Args:
             lib_path: Path to PKCS#11 library. Auto-detected if None.
 
+        The Java signer is created on first use; see preload().
+
         Raises:
-            PKCS11Error: If library cannot be found or loaded.
+            PKCS11Error: If library cannot be found.
         """
         self._lib_path: Path | None = None
         self._java_signer: JavaSigner | None = None
+        # (slot_id, PIN digest) -> (timestamp, certificates); never keyed by plain PIN
+        self._cert_cache: dict[tuple[int, bytes], tuple[float, list[CertificateInfo]]] = {}
 
         if lib_path:
             path = Path(lib_path)
-            if not validate_pkcs11_library(path):
-                raise PKCS11Error(f"Invalid PKCS#11 library: {path}")
+            resolved = path.resolve()
+            if resolved not in self._validated_libs:
+                if not validate_pkcs11_library(path):
+                    raise PKCS11Error(f"Invalid PKCS#11 library: {path}")
+                self._validated_libs.add(resolved)
             self._lib_path = path
         else:
-            self._lib_path = discover_pkcs11_library()
+            self._lib_path = self._discover_library()
             if not self._lib_path:
                 raise PKCS11Error(
                     "PKCS#11 library not found. "
                     "Please install Gemalto Middleware or specify library path."
                 )
 
-        # Initialize Java signer
-        try:
-            self._java_signer = JavaSigner(pkcs11_lib=str(self._lib_path))
-        except JavaSignerError as e:
-            raise PKCS11Error(f"Failed to initialize Java signer: {e}")
+        # Form passed to the Java signer
+        self._lib_path_str = str(self._lib_path)
+
+    @classmethod
+    def _discover_library(cls) -> Path | None:
+        """Discover the PKCS#11 library once per process."""
+        # Misses are not cached so middleware installed later is still found
+        if cls._discovered_lib is None or not cls._discovered_lib.exists():
+            cls._discovered_lib = discover_pkcs11_library()
+        return cls._discovered_lib
+
+    @classmethod
+    def reset_library_cache(cls) -> None:
+        """Forget discovered and validated libraries so they are checked again."""
+        cls._discovered_lib = None
+        cls._validated_libs.clear()
+
+    def _signer(self) -> JavaSigner:
+        """Get the Java signer, creating it on first use."""
+        if self._java_signer is None:
+            # Shared with other managers using this library
+            try:
+                self._java_signer = get_shared_signer(self._lib_path_str)
+            except JavaSignerError as e:
+                raise PKCS11Error(f"Failed to initialize Java signer: {e}")
+        return self._java_signer
+
+    def preload(self) -> None:
+        """
+        Create the Java signer and start its JVM ahead of first use.
+
+        Blocks while the JVM starts, so call it from a worker thread.
+
+        Raises:
+            PKCS11Error: If the Java signer cannot be created.
+        """
+        self._signer().warm_up()
 
     @property
     def library_path(self) -> Path | None:
@@ -94,15 +166,8 @@ class PKCS11Manager:
         Raises:
             PKCS11Error: If tokens cannot be enumerated.
         """
-        # Return a default token for slot 0 (LuxTrust cards use slot 0)
-        # The Java signer will verify if the token is present when listing certs
-        return [TokenInfo(
-            slot_id=0,
-            label="LuxTrust",
-            manufacturer="Thales DIS",
-            model="Smart Card",
-            serial="",
-        )]
+        # Return the default token for slot 0 (LuxTrust cards use slot 0)
+        return list(_DEFAULT_TOKENS)
 
     def list_certificates(self, slot_id: int, pin: str) -> list[CertificateInfo]:
         """
@@ -112,27 +177,30 @@ class PKCS11Manager:
             slot_id: PKCS#11 slot ID.
             pin: User PIN for the token.
 
+        Results are cached for CERT_CACHE_TTL_SECONDS per slot and PIN.
+
         Returns:
             List of CertificateInfo for signing certificates.
 
         Raises:
             PKCS11Error: If certificates cannot be read.
         """
-        if not self._java_signer:
-            raise PKCS11Error("Java signer not initialized")
+        key = (slot_id, hmac.digest(_PIN_DIGEST_KEY, pin.encode(), hashlib.sha256))
+        cached = self._cert_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.CERT_CACHE_TTL_SECONDS:
+            return list(cached[1])
 
         try:
-            java_certs = self._java_signer.list_certificates(pin, slot_id)
+            # Only signing certificates with a key on the token (no CA chain entries)
+            java_certs = self._signer().list_certificates(pin, slot_id, signing_only=True)
             certs = []
 
             for jc in java_certs:
-                # Extract CN from subject
-                subject_cn = self._extract_cn(jc.subject)
-
                 certs.append(CertificateInfo(
                     label=jc.alias,
-                    subject_cn=subject_cn,
-                    issuer_cn=self._extract_cn(jc.issuer),
+                    # Older signer JARs do not report CNs; parse them here then
+                    subject_cn=jc.subject_cn or self._extract_cn(jc.subject),
+                    issuer_cn=jc.issuer_cn or self._extract_cn(jc.issuer),
                     serial_number=jc.serial,
                     not_before=jc.not_before,
                     not_after=jc.not_after,
@@ -140,29 +208,30 @@ class PKCS11Manager:
                     can_sign=jc.can_sign,
                 ))
 
-            # Filter to only signing certificates
-            return [c for c in certs if c.can_sign]
+            self._cert_cache[key] = (time.monotonic(), certs)
+            return list(certs)
 
         except JavaSignerError as e:
+            # Token may have been removed or PIN changed
+            self.clear_cert_cache()
             error_msg = str(e).lower()
             if "pin" in error_msg:
                 raise PKCS11Error("Invalid PIN") from e
             raise PKCS11Error(f"Failed to list certificates: {e}") from e
 
+    def clear_cert_cache(self) -> None:
+        """Forget cached certificate lists, e.g. after the token changed."""
+        self._cert_cache.clear()
+
     def _extract_cn(self, dn: str) -> str:
         """Extract Common Name from distinguished name string."""
         # DN format: CN=Name,OU=...,O=...,C=...
-        for part in dn.split(","):
-            part = part.strip()
-            if part.upper().startswith("CN="):
-                return part[3:]
-        return dn
+        match = _CN_RE.search(dn)
+        return match.group(1).strip() if match else dn
 
     def get_java_signer(self) -> JavaSigner:
         """Get the underlying Java signer instance."""
-        if not self._java_signer:
-            raise PKCS11Error("Java signer not initialized")
-        return self._java_signer
+        return self._signer()
 
     def test_pin(self, slot_id: int, pin: str) -> bool:
         """
@@ -175,10 +244,7 @@ class PKCS11Manager:
         Returns:
             True if PIN is valid, False otherwise.
         """
-        if not self._java_signer:
-            return False
-
         try:
-            return self._java_signer.test_connection(pin, slot_id)
-        except JavaSignerError:
+            return self._signer().test_connection(pin, slot_id)
+        except (JavaSignerError, PKCS11Error):
             return False
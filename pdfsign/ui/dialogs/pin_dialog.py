@@ -1,5 +1,7 @@
 """PIN entry dialog for PKCS#11 token authentication."""
 
+import threading
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -11,11 +13,30 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 
 from pdfsign.crypto.pkcs11_manager import PKCS11Manager, TokenInfo, CertificateInfo, PKCS11Error
 
 
+class CertificateLoader(QThread):
+    """Worker thread listing the certificates of a token."""
+
+    loaded = Signal(list)
+    error = Signal(str)
+
+    def __init__(self, pkcs11_manager: PKCS11Manager, slot_id: int, pin: str):
+        super().__init__()
+        self._manager = pkcs11_manager
+        self._slot_id = slot_id
+        self._pin = pin
+
+    def run(self):
+        try:
+            self.loaded.emit(self._manager.list_certificates(self._slot_id, self._pin))
+        except PKCS11Error as e:
+            self.error.emit(str(e))
+
+
 class TokenSelectionDialog(QDialog):
     """Dialog for selecting a PKCS#11 token and certificate."""
 
@@ -27,12 +48,24 @@ class TokenSelectionDialog(QDialog):
         self._selected_token: TokenInfo | None = None
         self._selected_cert: CertificateInfo | None = None
         self._pin: str = ""
+        self._cert_loader: CertificateLoader | None = None
 
         self.setWindowTitle("Selection du token")
         self.setMinimumWidth(450)
         self._setup_ui()
         self._load_tokens()
 
+        # Start the JVM while the user types the PIN so unlocking is faster
+        threading.Thread(target=self._preload_signer, daemon=True).start()
+
+    def _preload_signer(self) -> None:
+        """Warm up the Java signer; runs on a background thread."""
+        try:
+            self._manager.preload()
+        except PKCS11Error:
+            # Reported again when certificates are listed
+            pass
+
     def _setup_ui(self) -> None:
         """Create the UI."""
         layout = QVBoxLayout(self)
@@ -104,6 +137,8 @@ class TokenSelectionDialog(QDialog):
         try:
             self._tokens = self._manager.list_tokens()
 
+            # Fill the combo silently, then handle the selection once
+            self._token_combo.blockSignals(True)
             self._token_combo.clear()
             for token in self._tokens:
                 self._token_combo.addItem(
@@ -116,6 +151,8 @@ class TokenSelectionDialog(QDialog):
                 self._token_combo.setEnabled(False)
                 self._pin_edit.setEnabled(False)
                 self._unlock_btn.setEnabled(False)
+            self._token_combo.blockSignals(False)
+            self._on_token_changed(self._token_combo.currentIndex())
 
         except PKCS11Error as e:
             QMessageBox.warning(
@@ -146,7 +183,7 @@ class TokenSelectionDialog(QDialog):
 
     def _on_unlock_clicked(self) -> None:
         """Handle unlock button click."""
-        if not self._selected_token:
+        if not self._selected_token or self._cert_loader is not None:
             return
 
         pin = self._pin_edit.text()
@@ -154,46 +191,72 @@ class TokenSelectionDialog(QDialog):
             QMessageBox.warning(self, "PIN requis", "Veuillez entrer votre PIN.")
             return
 
-        try:
-            self._certificates = self._manager.list_certificates(
-                self._selected_token.slot_id,
-                pin
-            )
+        # Enumerate certificates off the GUI thread; the token login can take a while
+        self._set_loading(True)
+        self._cert_loader = CertificateLoader(self._manager, self._selected_token.slot_id, pin)
+        self._cert_loader.loaded.connect(lambda certs: self._on_certs_loaded(certs, pin))
+        self._cert_loader.error.connect(self._on_certs_error)
+        self._cert_loader.finished.connect(self._on_loader_finished)
+        self._cert_loader.start()
 
-            if not self._certificates:
-                QMessageBox.warning(
-                    self,
-                    "Aucun certificat",
-                    "Aucun certificat de signature trouve sur ce token."
-                )
-                return
+    def _on_certs_loaded(self, certificates: list[CertificateInfo], pin: str) -> None:
+        """Populate the certificate list once the token has been read."""
+        self._certificates = certificates
 
-            self._pin = pin
-            self._cert_combo.clear()
-            self._cert_combo.setEnabled(True)
+        if not self._certificates:
+            QMessageBox.warning(
+                self,
+                "Aucun certificat",
+                "Aucun certificat de signature trouve sur ce token."
+            )
+            return
 
-            for cert in self._certificates:
-                self._cert_combo.addItem(
-                    f"{cert.subject_cn} ({cert.label})"
-                )
+        self._pin = pin
+        self._cert_combo.blockSignals(True)
+        self._cert_combo.clear()
+        self._cert_combo.addItems([
+            f"{cert.subject_cn} ({cert.label})" for cert in self._certificates
+        ])
+        self._cert_combo.blockSignals(False)
+        self._cert_combo.setEnabled(True)
 
-            self._on_cert_changed(0)
+        self._on_cert_changed(0)
 
-        except PKCS11Error as e:
-            error_msg = str(e)
-            if "PIN" in error_msg.upper():
-                QMessageBox.warning(
-                    self,
-                    "PIN incorrect",
-                    "Le PIN entre est incorrect.\n"
-                    "Attention: apres 3 tentatives incorrectes, le token sera bloque."
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Erreur",
-                    f"Impossible d'acceder au token:\n{e}"
-                )
+    def _on_certs_error(self, error_msg: str) -> None:
+        """Report a failure to read the token."""
+        if "PIN" in error_msg.upper():
+            QMessageBox.warning(
+                self,
+                "PIN incorrect",
+                "Le PIN entre est incorrect.\n"
+                "Attention: apres 3 tentatives incorrectes, le token sera bloque."
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Erreur",
+                f"Impossible d'acceder au token:\n{error_msg}"
+            )
+
+    def _on_loader_finished(self) -> None:
+        """Re-enable the dialog after certificate enumeration."""
+        self._cert_loader = None
+        self._set_loading(False)
+
+    def _set_loading(self, loading: bool) -> None:
+        """Lock the dialog while certificates are being read."""
+        self._token_combo.setEnabled(not loading and bool(self._tokens))
+        self._pin_edit.setEnabled(not loading)
+        self._unlock_btn.setEnabled(not loading)
+        self._cancel_btn.setEnabled(not loading)
+        self._ok_btn.setEnabled(not loading and self._selected_cert is not None)
+        self._unlock_btn.setText("Lecture..." if loading else "Deverrouiller")
+
+    def reject(self) -> None:
+        """Ignore cancel while the token is being read; the worker must finish first."""
+        if self._cert_loader is not None:
+            return
+        super().reject()
 
     def _on_cert_changed(self, index: int) -> None:
         """Handle certificate selection change."""
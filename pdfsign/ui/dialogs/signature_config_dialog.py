@@ -1,5 +1,6 @@
 """Signature appearance configuration dialog."""
 
+from dataclasses import replace
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -18,18 +19,32 @@ from PySide6.QtWidgets import (
     QFrame,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImageReader, QPixmap, QPixmapCache
 
 from pdfsign.core.signature_manager import SignatureAppearance, SignatureAppearanceType
 
+PREVIEW_SIZE = (200, 80)
+
+# Shared starting value; SignatureAppearance is immutable, _on_ok builds a new one
+_DEFAULT_APPEARANCE = SignatureAppearance()
+
+# Appearance type -> (text options enabled, image options enabled)
+_SECTION_STATES = {
+    SignatureAppearanceType.TEXT: (True, False),
+    SignatureAppearanceType.IMAGE: (False, True),
+    SignatureAppearanceType.TEXT_AND_IMAGE: (True, True),
+}
+
 
 class SignatureConfigDialog(QDialog):
     """Dialog for configuring signature appearance."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._appearance = SignatureAppearance()
+        self._appearance = _DEFAULT_APPEARANCE
         self._image_path: Path | None = None
+        # Selected appearance type, kept in sync by _on_type_changed
+        self._current_type = SignatureAppearanceType.TEXT
 
         self.setWindowTitle("Configuration de la signature")
         self.setMinimumWidth(500)
@@ -58,6 +73,12 @@ class SignatureConfigDialog(QDialog):
         self._type_group.addButton(self._both_radio, SignatureAppearanceType.TEXT_AND_IMAGE.value)
         type_layout.addWidget(self._both_radio)
 
+        self._radios = {
+            SignatureAppearanceType.TEXT: self._text_radio,
+            SignatureAppearanceType.IMAGE: self._image_radio,
+            SignatureAppearanceType.TEXT_AND_IMAGE: self._both_radio,
+        }
+
         self._type_group.idToggled.connect(self._on_type_changed)
 
         layout.addWidget(type_group)
@@ -169,23 +190,44 @@ class SignatureConfigDialog(QDialog):
         except ValueError:
             return
 
+        self._current_type = app_type
+
         # Enable/disable sections based on type
-        self._text_group.setEnabled(
-            app_type in (SignatureAppearanceType.TEXT, SignatureAppearanceType.TEXT_AND_IMAGE)
-        )
-        self._image_group.setEnabled(
-            app_type in (SignatureAppearanceType.IMAGE, SignatureAppearanceType.TEXT_AND_IMAGE)
-        )
+        text_enabled, image_enabled = _SECTION_STATES[app_type]
+        self._text_group.setEnabled(text_enabled)
+        self._image_group.setEnabled(image_enabled)
 
     def _update_image_preview(self, image_path: Path) -> None:
         """Load and display an image preview scaled to fit."""
-        pixmap = QPixmap(str(image_path))
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                200, 80,
+        # Scaled previews live in Qt's shared pixmap cache while the file is unchanged
+        try:
+            stat = image_path.stat()
+            key = f"sigpreview:{image_path}:{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            key = None
+
+        cached = QPixmapCache.find(key) if key else None
+        if cached is not None and not cached.isNull():
+            self._preview_label.setPixmap(cached)
+            return
+
+        # Let the decoder downscale while reading instead of decoding full size
+        reader = QImageReader(str(image_path))
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(*PREVIEW_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+
+        if not image.isNull():
+            scaled = QPixmap.fromImage(image).scaled(
+                *PREVIEW_SIZE,
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation
             )
+            if key:
+                QPixmapCache.insert(key, scaled)
             self._preview_label.setPixmap(scaled)
         else:
             self._preview_label.setText("Impossible de charger l'image")
@@ -218,22 +260,17 @@ class SignatureConfigDialog(QDialog):
 
     def _on_ok(self) -> None:
         """Handle OK button click."""
-        # Determine appearance type
-        checked_id = self._type_group.checkedId()
-        try:
-            self._appearance.type = SignatureAppearanceType(checked_id)
-        except ValueError:
-            self._appearance.type = SignatureAppearanceType.TEXT
-
-        # Collect text options
-        self._appearance.name = self._name_edit.text()
-        self._appearance.reason = self._reason_edit.text()
-        self._appearance.location = self._location_edit.text()
-        self._appearance.include_date = self._date_checkbox.isChecked()
-        self._appearance.font_size = self._font_size_spin.value()
-
-        # Collect image options
-        self._appearance.image_path = self._image_path
+        # Fields not edited here (e.g. contact) carry over unchanged
+        self._appearance = replace(
+            self._appearance,
+            type=self._current_type,
+            name=self._name_edit.text(),
+            reason=self._reason_edit.text(),
+            location=self._location_edit.text(),
+            include_date=self._date_checkbox.isChecked(),
+            font_size=self._font_size_spin.value(),
+            image_path=self._image_path,
+        )
 
         self.accept()
 
@@ -246,12 +283,7 @@ class SignatureConfigDialog(QDialog):
         self._appearance = appearance
 
         # Set type
-        if appearance.type == SignatureAppearanceType.TEXT:
-            self._text_radio.setChecked(True)
-        elif appearance.type == SignatureAppearanceType.IMAGE:
-            self._image_radio.setChecked(True)
-        else:
-            self._both_radio.setChecked(True)
+        self._radios.get(appearance.type, self._both_radio).setChecked(True)
 
         # Set text options
         self._name_edit.setText(appearance.name)
@@ -1,5 +1,6 @@
 """Main application window."""
 
+import threading
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -16,27 +17,38 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QProgressDialog,
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QSignalBlocker, QThreadPool, Signal, Slot,
+)
 from PySide6.QtGui import QAction, QKeySequence
 
 from pdfsign.core.pdf_document import PDFDocument
 from pdfsign.core.signature_manager import (
     SignatureManager, SignatureConfig, SignatureAppearance, SignaturePosition,
 )
-from pdfsign.utils.settings import save_signature_appearance, load_signature_appearance
+from pdfsign.utils.settings import (
+    save_signature_appearance,
+    load_signature_appearance,
+    save_signature_position,
+    load_signature_position,
+)
 from pdfsign.crypto.pkcs11_manager import PKCS11Manager, PKCS11Error
 from pdfsign.ui.pdf_viewer import PDFViewer
 from pdfsign.ui.dialogs.pin_dialog import TokenSelectionDialog
 from pdfsign.ui.dialogs.signature_config_dialog import SignatureConfigDialog
 
 
-class SignatureWorker(QThread):
-    """Worker thread for PDF signing operations."""
+class SignatureSignals(QObject):
+    """Signals of a SignatureRunnable, which cannot emit them itself."""
 
     progress = Signal(str)
     finished = Signal(Path)
     error = Signal(str)
 
+
+class SignatureRunnable(QRunnable):
+    """Pooled task for PDF signing operations."""
+
     def __init__(
         self,
         signature_manager: SignatureManager,
@@ -48,6 +60,7 @@ class SignatureWorker(QThread):
         slot: int = 0,
     ):
         super().__init__()
+        self.signals = SignatureSignals()
         self._manager = signature_manager
         self._input_path = input_path
         self._output_path = output_path
@@ -58,7 +71,7 @@ class SignatureWorker(QThread):
 
     def run(self):
         try:
-            self.progress.emit("Signature en cours...")
+            self.signals.progress.emit("Signature en cours...")
             result = self._manager.sign_pdf(
                 self._input_path,
                 self._output_path,
@@ -67,9 +80,9 @@ class SignatureWorker(QThread):
                 self._alias,
                 self._slot,
             )
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -82,6 +95,8 @@ class MainWindow(QMainWindow):
         self._signature_manager = SignatureManager()
         self._pkcs11_manager: PKCS11Manager | None = None
         self._current_file: Path | None = None
+        self._active_progress: QProgressDialog | None = None
+        self._signing_signals: SignatureSignals | None = None
 
         # Load saved signature appearance or use default
         saved_appearance = load_signature_appearance()
@@ -95,8 +110,14 @@ class MainWindow(QMainWindow):
         self._setup_statusbar()
         self._setup_connections()
 
+        # Place the signature rect where it was used last session
+        self._viewer.remember_signature_position(load_signature_position())
+
         self._init_pkcs11()
 
+        # Start the JVM early so the first signature is not delayed
+        threading.Thread(target=SignatureManager.warm_up, daemon=True).start()
+
     def _setup_ui(self) -> None:
         """Create the main UI."""
         central = QWidget()
@@ -225,6 +246,7 @@ class MainWindow(QMainWindow):
 
     # File operations
 
+    @Slot()
     def _on_open(self) -> None:
         """Handle open file action."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -275,40 +297,47 @@ class MainWindow(QMainWindow):
         count = len(signatures)
         if count == 1:
             title = "Signature numerique detectee"
-            message = "Ce document contient une signature numerique:\n\n"
+            parts = ["Ce document contient une signature numerique:\n\n"]
         else:
             title = f"{count} signatures numeriques detectees"
-            message = f"Ce document contient {count} signatures numeriques:\n\n"
+            parts = [f"Ce document contient {count} signatures numeriques:\n\n"]
 
         for i, sig in enumerate(signatures, 1):
-            message += f"{i}. {sig.signer}\n"
-            message += f"   Champ: {sig.field_name} (page {sig.page})\n"
+            parts.append(f"{i}. {sig.signer}\n")
+            parts.append(f"   Champ: {sig.field_name} (page {sig.page})\n")
             if sig.signed_on:
-                message += f"   Date: {sig.signed_on}\n"
-            message += "\n"
+                parts.append(f"   Date: {sig.signed_on}\n")
+            parts.append("\n")
 
-        message += "Ajouter une nouvelle signature conservera les signatures existantes."
+        parts.append("Ajouter une nouvelle signature conservera les signatures existantes.")
+        message = "".join(parts)
 
         QMessageBox.information(self, title, message)
 
     # Navigation
 
+    @Slot(int)
     def _on_page_changed(self, page: int) -> None:
         """Handle page change."""
-        self._page_spin.blockSignals(True)
-        self._page_spin.setValue(page + 1)
-        self._page_spin.blockSignals(False)
+        if self._page_spin.value() == page + 1:
+            return
+        with QSignalBlocker(self._page_spin):
+            self._page_spin.setValue(page + 1)
 
+    @Slot(int)
     def _on_page_spin_changed(self, value: int) -> None:
         """Handle page spin change."""
-        self._viewer.go_to_page(value - 1)
+        if value - 1 != self._viewer.current_page:
+            self._viewer.go_to_page(value - 1)
 
+    @Slot(float)
     def _on_zoom_changed(self, zoom: float) -> None:
         """Handle zoom change."""
         self._zoom_label.setText(f"{int(zoom * 100)}%")
 
     # Signature
 
+    @Slot(bool)
     def _on_place_signature(self, checked: bool) -> None:
         """Toggle signature placement mode."""
         if checked:
@@ -320,6 +349,7 @@ class MainWindow(QMainWindow):
             self._viewer.hide_signature_rect()
             self._status_label.setText("Pret")
 
+    @Slot()
     def _on_config_signature(self) -> None:
         """Open signature configuration dialog."""
         dialog = SignatureConfigDialog(self)
@@ -331,6 +361,7 @@ class MainWindow(QMainWindow):
             save_signature_appearance(self._signature_appearance)
             self._status_label.setText("Configuration de signature sauvegardee")
 
+    @Slot()
     def _on_select_token(self) -> None:
         """Open token selection dialog."""
         if not self._pkcs11_manager:
@@ -348,6 +379,7 @@ class MainWindow(QMainWindow):
             if token and cert:
                 self._token_action.setText(f"Token: {cert.subject_cn}")
 
+    @Slot()
     def _on_sign_clicked(self) -> None:
         """Handle sign button click."""
         if not self._document.is_open or not self._current_file:
@@ -375,6 +407,7 @@ class MainWindow(QMainWindow):
                 "Veuillez placer le rectangle de signature sur le document."
             )
             return
+        save_signature_position(position)
 
         # Select token and certificate
         dialog = TokenSelectionDialog(self._pkcs11_manager, self)
@@ -414,8 +447,8 @@ class MainWindow(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.show()
 
-        # Run signing in worker thread
-        self._worker = SignatureWorker(
+        # Run signing on a pooled thread
+        runnable = SignatureRunnable(
             self._signature_manager,
             self._current_file,
             Path(output_path),
@@ -424,13 +457,23 @@ class MainWindow(QMainWindow):
             alias=cert.label,
             slot=token.slot_id,
         )
-        self._worker.finished.connect(lambda p: self._on_signing_finished(p, progress))
-        self._worker.error.connect(lambda e: self._on_signing_error(e, progress))
-        self._worker.start()
-
-    def _on_signing_finished(self, output_path: Path, progress: QProgressDialog) -> None:
+        self._active_progress = progress
+        # The pool owns the runnable; keep its signals alive until delivered
+        self._signing_signals = runnable.signals
+        self._signing_signals.finished.connect(self._on_signing_finished)
+        self._signing_signals.error.connect(self._on_signing_error)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _close_active_progress(self) -> None:
+        """Close the progress dialog of the running signature, if any."""
+        if self._active_progress is not None:
+            self._active_progress.close()
+            self._active_progress = None
+
+    @Slot(object)
+    def _on_signing_finished(self, output_path: Path) -> None:
         """Handle successful signing."""
-        progress.close()
+        self._close_active_progress()
         QMessageBox.information(
             self,
             "Signature reussie",
@@ -448,9 +491,10 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             self._open_file(output_path)
 
-    def _on_signing_error(self, error: str, progress: QProgressDialog) -> None:
+    @Slot(str)
+    def _on_signing_error(self, error: str) -> None:
         """Handle signing error."""
-        progress.close()
+        self._close_active_progress()
         QMessageBox.critical(
             self,
             "Erreur de signature",
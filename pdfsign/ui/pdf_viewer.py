@@ -1,19 +1,22 @@
 """PDF viewer widget with signature overlay support."""
 
+import math
+
 from PySide6.QtWidgets import (
     QGraphicsView,
     QGraphicsScene,
     QGraphicsPixmapItem,
 )
-from PySide6.QtCore import Qt, Signal, QRectF, QPointF
+from PySide6.QtCore import Qt, Signal, Slot, QRectF, QPointF, QTimer
 from PySide6.QtGui import (
     QWheelEvent,
     QMouseEvent,
     QPainter,
     QPixmap,
+    QTransform,
 )
 
-from pdfsign.core.pdf_document import PDFDocument
+from pdfsign.core.pdf_document import PDFDocument, PageInfo
 from pdfsign.ui.signature_rect import SignatureRectItem
 from pdfsign.utils.coordinates import qt_to_pdf_rect, pdf_to_qt_rect, PDFRect
 
@@ -25,7 +28,8 @@ class PDFViewer(QGraphicsView):
     Signals:
         page_changed(int): Emitted when current page changes.
         zoom_changed(float): Emitted when zoom level changes.
-        signature_position_changed(PDFRect): Emitted when signature rect moves.
+        signature_position_changed(PDFRect): Emitted when a drag of the
+            signature rect ends at a new position.
     """
 
     page_changed = Signal(int)
@@ -35,6 +39,14 @@ class PDFViewer(QGraphicsView):
     MIN_ZOOM = 0.25
     MAX_ZOOM = 4.0
     ZOOM_STEP = 0.1
+    # Re-render once zooming pauses for this long; until then the view is scaled
+    ZOOM_DEBOUNCE_MS = 40
+    # Idle time after a page is shown before neighbor pages are pre-rendered
+    PREFETCH_DELAY_MS = 150
+    # Relative zoom change below which set_zoom does nothing
+    ZOOM_EPSILON = 0.01
+    # Fit zooms snap to this step so resizes tend to hit cached renders
+    FIT_ZOOM_STEP = 0.05
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -45,10 +57,34 @@ class PDFViewer(QGraphicsView):
         self._document: PDFDocument | None = None
         self._current_page = 0
         self._zoom = 1.0
+        # Page and zoom the displayed pixmap was rendered at (scene units per PDF point)
+        self._rendered_page = 0
+        self._rendered_zoom = 1.0
+
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(self.ZOOM_DEBOUNCE_MS)
+        self._zoom_timer.timeout.connect(self._render_current_page)
+
+        # Neighbor pages are rendered into the document's cache while idle.
+        # PyMuPDF is not thread-safe, so this stays on the GUI thread, one
+        # page per timer tick.
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(self.PREFETCH_DELAY_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch_neighbor)
 
         self._page_item: QGraphicsPixmapItem | None = None
+        # Page sizes of the current document, looked up on zoom-fit and signature moves
+        self._page_info_cache: dict[int, PageInfo] = {}
         self._signature_rect: SignatureRectItem | None = None
         self._signature_visible = False
+        # Where the rect was last placed, restored when it is shown again
+        self._last_signature_position: PDFRect | None = None
+        # Scene rect of the signature when the left button went down, and the
+        # last position reported through signature_position_changed
+        self._press_signature_rect: QRectF | None = None
+        self._emitted_signature_position: PDFRect | None = None
 
         # Panning state
         self._panning = False
@@ -70,6 +106,10 @@ class PDFViewer(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.setBackgroundBrush(Qt.GlobalColor.darkGray)
+        # Dragging the signature rect only repaints its own bounds
+        self.setViewportUpdateMode(
+            QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+        )
 
     def set_document(self, document: PDFDocument) -> None:
         """
@@ -80,60 +120,123 @@ class PDFViewer(QGraphicsView):
         """
         self._document = document
         self._current_page = 0
+        self._page_info_cache = {}
+        # A new document starts with the signature rect at its default spot
+        if self._signature_rect:
+            self._scene.removeItem(self._signature_rect)
+            self._signature_rect = None
         self._render_current_page()
 
     def clear_document(self) -> None:
         """Clear the current document."""
+        self._zoom_timer.stop()
+        self._prefetch_timer.stop()
+        self.resetTransform()
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
         self._document = None
+        self._page_info_cache = {}
         self._scene.clear()
         self._page_item = None
         self._signature_rect = None
         self._signature_visible = False
 
+    def _page_info(self, page_num: int) -> PageInfo:
+        """Get a page's info from the document once, then from the cache."""
+        page_info = self._page_info_cache.get(page_num)
+        if page_info is None:
+            page_info = self._document.get_page_info(page_num)
+            self._page_info_cache[page_num] = page_info
+        return page_info
+
+    @Slot()
     def _render_current_page(self) -> None:
         """Render and display the current page."""
         if not self._document:
             return
 
-        # Clear previous page
-        self._scene.clear()
-        self._signature_rect = None
+        # A full render supersedes any pending zoom preview
+        self._zoom_timer.stop()
+        self.resetTransform()
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+
+        # Remember where the signature sits in PDF terms before the scene rescales
+        signature_pdf_rect = self._signature_position_on(self._rendered_page)
 
-        # Render page at current zoom
-        pixmap = self._document.render_page(self._current_page, self._zoom)
+        # Rasterize at device resolution so HiDPI screens paint the pixmap 1:1;
+        # the device pixel ratio keeps scene units at the logical zoom
+        dpr = self.devicePixelRatioF()
+        pixmap = self._document.render_page(self._current_page, self._zoom * dpr)
+        pixmap.setDevicePixelRatio(dpr)
 
-        # Add to scene
-        self._page_item = QGraphicsPixmapItem(pixmap)
-        self._scene.addItem(self._page_item)
+        # Reuse the page item instead of rebuilding the scene
+        if self._page_item is None:
+            self._page_item = QGraphicsPixmapItem()
+            self._scene.addItem(self._page_item)
+        self._page_item.setPixmap(pixmap)
 
         # Update scene rect
         self._scene.setSceneRect(self._page_item.boundingRect())
-
-        # Restore signature rect if visible
-        if self._signature_visible:
+        self._rendered_page = self._current_page
+        self._rendered_zoom = self._zoom
+
+        # Keep the signature rect where the user put it, or add it if visible
+        if signature_pdf_rect is not None:
+            page_info = self._page_info(self._current_page)
+            self._place_signature_rect(
+                pdf_to_qt_rect(signature_pdf_rect, page_info.height, self._zoom)
+            )
+        elif self._signature_visible:
             self._add_signature_rect()
 
+        self._prefetch_timer.start()
         self.page_changed.emit(self._current_page)
 
-    def _add_signature_rect(self) -> None:
-        """Add the signature rectangle overlay."""
-        if not self._page_item:
+    @Slot()
+    def _prefetch_neighbor(self) -> None:
+        """Render the next uncached neighbor page, then reschedule."""
+        if not self._document:
             return
 
-        page_rect = self._page_item.boundingRect()
+        document = self._document
+        zoom = self._zoom * self.devicePixelRatioF()
+        for page_num in (self._current_page + 1, self._current_page - 1):
+            if 0 <= page_num < document.page_count and not document.is_rendered(page_num, zoom):
+                document.render_page(page_num, zoom)
+                self._prefetch_timer.start()
+                return
 
-        # Default position: bottom-right area
-        default_width = 200 * self._zoom
-        default_height = 80 * self._zoom
-        default_x = page_rect.width() - default_width - 50 * self._zoom
-        default_y = page_rect.height() - default_height - 50 * self._zoom
+    def _add_signature_rect(self, initial_rect: QRectF | None = None) -> None:
+        """
+        Add the signature rectangle overlay.
+
+        Args:
+            initial_rect: Scene rectangle to start at; bottom-right default if None.
+        """
+        if not self._page_item:
+            return
+
+        if initial_rect is None:
+            initial_rect = self._default_signature_rect()
 
         self._signature_rect = SignatureRectItem(
-            default_x, default_y, default_width, default_height
+            initial_rect.x(), initial_rect.y(), initial_rect.width(), initial_rect.height()
         )
         self._scene.addItem(self._signature_rect)
         self._signature_rect.setSelected(True)
 
+    def _default_signature_rect(self) -> QRectF:
+        """Get the default signature rectangle: bottom-right area, in scene units."""
+        page_rect = self._page_item.boundingRect()
+        zoom = self._rendered_zoom
+        default_width = 200 * zoom
+        default_height = 80 * zoom
+        return QRectF(
+            page_rect.width() - default_width - 50 * zoom,
+            page_rect.height() - default_height - 50 * zoom,
+            default_width,
+            default_height,
+        )
+
     # Navigation
 
     @property
@@ -153,14 +256,19 @@ class PDFViewer(QGraphicsView):
         if not self._document:
             return
 
+        if page_num == self._current_page:
+            return
+
         if 0 <= page_num < self._document.page_count:
             self._current_page = page_num
             self._render_current_page()
 
+    @Slot()
     def next_page(self) -> None:
         """Go to next page."""
         self.go_to_page(self._current_page + 1)
 
+    @Slot()
     def previous_page(self) -> None:
         """Go to previous page."""
         self.go_to_page(self._current_page - 1)
@@ -175,36 +283,55 @@ class PDFViewer(QGraphicsView):
     def set_zoom(self, zoom: float) -> None:
         """Set zoom level."""
         zoom = max(self.MIN_ZOOM, min(self.MAX_ZOOM, zoom))
+        # Changes this small are invisible; still allow landing on the limits
+        if (
+            abs(zoom - self._zoom) < self.ZOOM_EPSILON * self._zoom
+            and zoom not in (self.MIN_ZOOM, self.MAX_ZOOM)
+        ):
+            return
         if zoom != self._zoom:
             self._zoom = zoom
-            self._render_current_page()
+            if self._page_item:
+                # Scale the current pixmap for immediate feedback and
+                # rasterize once the user stops zooming
+                factor = zoom / self._rendered_zoom
+                # Preview frames are short-lived; skip bilinear filtering for them
+                self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+                self.setTransform(QTransform.fromScale(factor, factor))
+                self._prefetch_timer.stop()
+                self._zoom_timer.start()
+            else:
+                self._render_current_page()
             self.zoom_changed.emit(self._zoom)
 
+    @Slot()
     def zoom_in(self) -> None:
         """Increase zoom level."""
         self.set_zoom(self._zoom + self.ZOOM_STEP)
 
+    @Slot()
     def zoom_out(self) -> None:
         """Decrease zoom level."""
         self.set_zoom(self._zoom - self.ZOOM_STEP)
 
+    @Slot()
     def zoom_fit_width(self) -> None:
         """Zoom to fit page width in viewport."""
         if not self._document:
             return
 
-        page_info = self._document.get_page_info(self._current_page)
+        page_info = self._page_info(self._current_page)
         viewport_width = self.viewport().width() - 20  # Margin
 
         new_zoom = viewport_width / page_info.width
-        self.set_zoom(new_zoom)
+        self.set_zoom(self._snap_fit_zoom(new_zoom))
 
     def zoom_fit_page(self) -> None:
         """Zoom to fit entire page in viewport."""
         if not self._document:
             return
 
-        page_info = self._document.get_page_info(self._current_page)
+        page_info = self._page_info(self._current_page)
         viewport = self.viewport()
         viewport_width = viewport.width() - 20
         viewport_height = viewport.height() - 20
@@ -212,7 +339,13 @@ class PDFViewer(QGraphicsView):
         zoom_w = viewport_width / page_info.width
         zoom_h = viewport_height / page_info.height
 
-        self.set_zoom(min(zoom_w, zoom_h))
+        self.set_zoom(self._snap_fit_zoom(min(zoom_w, zoom_h)))
+
+    def _snap_fit_zoom(self, zoom: float) -> float:
+        """Round a fit zoom down to a FIT_ZOOM_STEP, so the page still fits."""
+        # The epsilon keeps exact multiples such as 0.15 from losing a step to float error
+        steps = math.floor(zoom / self.FIT_ZOOM_STEP + 1e-9)
+        return max(self.MIN_ZOOM, steps * self.FIT_ZOOM_STEP)
 
     def zoom_reset(self) -> None:
         """Reset zoom to 100%."""
@@ -221,18 +354,31 @@ class PDFViewer(QGraphicsView):
     # Signature
 
     def show_signature_rect(self) -> None:
-        """Show the signature placement rectangle."""
+        """Show the signature placement rectangle, where it was last placed."""
         self._signature_visible = True
         if not self._signature_rect and self._page_item:
-            self._add_signature_rect()
+            if self._last_signature_position is not None:
+                self.set_signature_position(self._last_signature_position)
+            else:
+                self._add_signature_rect()
 
     def hide_signature_rect(self) -> None:
         """Hide the signature placement rectangle."""
         self._signature_visible = False
         if self._signature_rect:
+            self._last_signature_position = self.get_signature_position()
             self._scene.removeItem(self._signature_rect)
             self._signature_rect = None
 
+    def remember_signature_position(self, pdf_rect: PDFRect | None) -> None:
+        """
+        Set where show_signature_rect places the rectangle.
+
+        Args:
+            pdf_rect: Position in PDF coordinate system, or None for the default.
+        """
+        self._last_signature_position = pdf_rect
+
     def get_signature_position(self) -> PDFRect | None:
         """
         Get the signature rectangle position in PDF coordinates.
@@ -240,6 +386,10 @@ class PDFViewer(QGraphicsView):
         Returns:
             PDFRect in PDF coordinate system, or None if not set.
         """
+        return self._signature_position_on(self._rendered_page)
+
+    def _signature_position_on(self, page_num: int) -> PDFRect | None:
+        """Get the signature rectangle in the PDF coordinates of page_num."""
         if not self._signature_rect or not self._document:
             return None
 
@@ -247,31 +397,43 @@ class PDFViewer(QGraphicsView):
         scene_rect = self._signature_rect.get_scene_rect()
 
         # Get page dimensions
-        page_info = self._document.get_page_info(self._current_page)
+        page_info = self._page_info(page_num)
 
-        # Convert to PDF coordinates
-        return qt_to_pdf_rect(scene_rect, page_info.height, self._zoom)
+        # Convert to PDF coordinates; the scene is at the rendered zoom
+        return qt_to_pdf_rect(scene_rect, page_info.height, self._rendered_zoom)
+
+    def _place_signature_rect(self, scene_rect: QRectF) -> None:
+        """Move the signature rectangle to a scene rectangle."""
+        # Dragging moves the item's position, so fold it back into the rect
+        self._signature_rect.setPos(0, 0)
+        self._signature_rect.setRect(scene_rect)
 
     def set_signature_position(self, pdf_rect: PDFRect) -> None:
         """
         Set the signature rectangle from PDF coordinates.
 
+        The rectangle is moved inside the current page if it sticks out,
+        e.g. a position saved for a larger page; one that cannot fit at
+        all falls back to the default placement.
+
         Args:
             pdf_rect: Position in PDF coordinate system.
         """
-        if not self._document:
+        if not self._document or not self._page_item:
             return
 
-        page_info = self._document.get_page_info(self._current_page)
-        qt_rect = pdf_to_qt_rect(pdf_rect, page_info.height, self._zoom)
+        page_info = self._page_info(self._current_page)
+        qt_rect = pdf_to_qt_rect(pdf_rect, page_info.height, self._rendered_zoom)
+        page_rect = self._page_item.boundingRect()
+        if qt_rect.width() > page_rect.width() or qt_rect.height() > page_rect.height():
+            qt_rect = self._default_signature_rect()
 
         self._signature_visible = True
         if self._signature_rect:
-            self._signature_rect.setRect(qt_rect)
+            self._place_signature_rect(qt_rect)
         else:
-            self._add_signature_rect()
-            if self._signature_rect:
-                self._signature_rect.setRect(qt_rect)
+            self._add_signature_rect(qt_rect)
+        self._signature_rect.constrain_to_bounds(page_rect)
 
     # Events
 
@@ -297,6 +459,8 @@ class PDFViewer(QGraphicsView):
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
             event.accept()
         else:
+            if event.button() == Qt.MouseButton.LeftButton and self._signature_rect:
+                self._press_signature_rect = self._signature_rect.get_scene_rect()
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
@@ -305,7 +469,7 @@ class PDFViewer(QGraphicsView):
             delta = event.position() - self._pan_start
             self._pan_start = event.position()
 
-            # Scroll the view
+            # Scroll the view; Qt coalesces both scroll blits into one paint
             self.horizontalScrollBar().setValue(
                 self.horizontalScrollBar().value() - int(delta.x())
             )
@@ -325,3 +489,19 @@ class PDFViewer(QGraphicsView):
             event.accept()
         else:
             super().mouseReleaseEvent(event)
+            if event.button() == Qt.MouseButton.LeftButton:
+                self._emit_signature_moved()
+
+    def _emit_signature_moved(self) -> None:
+        """Report the signature position once per drag or resize that moved it."""
+        press_rect = self._press_signature_rect
+        self._press_signature_rect = None
+        if press_rect is None or not self._signature_rect:
+            return
+        if self._signature_rect.get_scene_rect() == press_rect:
+            return
+
+        position = self.get_signature_position()
+        if position != self._emitted_signature_position:
+            self._emitted_signature_position = position
+            self.signature_position_changed.emit(position)
@@ -1,22 +1,47 @@
 """Draggable and resizable signature rectangle overlay."""
 
-from enum import Enum, auto
+from enum import IntFlag
 from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsItem
-from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QPen, QBrush, QColor, QPainter, QCursor
-
-
-class ResizeHandle(Enum):
-    """Resize handle positions."""
-    NONE = auto()
-    TOP_LEFT = auto()
-    TOP_RIGHT = auto()
-    BOTTOM_LEFT = auto()
-    BOTTOM_RIGHT = auto()
-    TOP = auto()
-    BOTTOM = auto()
-    LEFT = auto()
-    RIGHT = auto()
+from PySide6.QtCore import Qt, QRectF, QPointF, QTimer
+from PySide6.QtGui import QPen, QBrush, QColor, QPainter, QPainterPath, QCursor
+
+
+class ResizeHandle(IntFlag):
+    """Resize handle positions, as the set of edges each one moves."""
+    NONE = 0
+    TOP = 1
+    BOTTOM = 2
+    LEFT = 4
+    RIGHT = 8
+    TOP_LEFT = TOP | LEFT
+    TOP_RIGHT = TOP | RIGHT
+    BOTTOM_LEFT = BOTTOM | LEFT
+    BOTTOM_RIGHT = BOTTOM | RIGHT
+
+
+# Handle at each (row, column) of the 3x3 grid of corners and edge midpoints
+_HANDLE_GRID = (
+    (ResizeHandle.TOP_LEFT, ResizeHandle.TOP, ResizeHandle.TOP_RIGHT),
+    (ResizeHandle.LEFT, ResizeHandle.NONE, ResizeHandle.RIGHT),
+    (ResizeHandle.BOTTOM_LEFT, ResizeHandle.BOTTOM, ResizeHandle.BOTTOM_RIGHT),
+)
+
+# Cursor for each handle, indexed by its edge bits; impossible combinations
+# such as TOP | BOTTOM get the arrow
+_HANDLE_CURSORS: tuple[Qt.CursorShape, ...] = tuple(
+    {
+        ResizeHandle.TOP_LEFT: Qt.CursorShape.SizeFDiagCursor,
+        ResizeHandle.BOTTOM_RIGHT: Qt.CursorShape.SizeFDiagCursor,
+        ResizeHandle.TOP_RIGHT: Qt.CursorShape.SizeBDiagCursor,
+        ResizeHandle.BOTTOM_LEFT: Qt.CursorShape.SizeBDiagCursor,
+        ResizeHandle.TOP: Qt.CursorShape.SizeVerCursor,
+        ResizeHandle.BOTTOM: Qt.CursorShape.SizeVerCursor,
+        ResizeHandle.LEFT: Qt.CursorShape.SizeHorCursor,
+        ResizeHandle.RIGHT: Qt.CursorShape.SizeHorCursor,
+        ResizeHandle.NONE: Qt.CursorShape.SizeAllCursor,
+    }.get(bits, Qt.CursorShape.ArrowCursor)
+    for bits in range(16)
+)
 
 
 class SignatureRectItem(QGraphicsRectItem):
@@ -31,9 +56,15 @@ class SignatureRectItem(QGraphicsRectItem):
     """
 
     HANDLE_SIZE = 8
+    # Resize at most once per frame however fast the mouse reports moves
+    RESIZE_INTERVAL_MS = 16
     MIN_WIDTH = 100
     MIN_HEIGHT = 50
 
+    # Resize handle style, shared by all instances
+    _handle_pen = QPen(QColor(0, 120, 212), 1)
+    _handle_brush = QBrush(Qt.GlobalColor.white)
+
     def __init__(
         self,
         x: float = 0,
@@ -47,12 +78,20 @@ class SignatureRectItem(QGraphicsRectItem):
         self._current_handle = ResizeHandle.NONE
         self._drag_start_pos: QPointF | None = None
         self._drag_start_rect: QRectF | None = None
-
-        # Make item interactive
+        # Latest resize drag position, applied on the next timer tick
+        self._pending_resize_pos: QPointF | None = None
+        self._resize_timer = QTimer()
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_INTERVAL_MS)
+        self._resize_timer.timeout.connect(self._apply_pending_resize)
+        # Outline of all handles for the current rect(), rebuilt lazily after setRect
+        self._handles_path: QPainterPath | None = None
+
+        # Make item interactive. No itemChange override consumes geometry
+        # notifications, so ItemSendsGeometryChanges is left off
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsMovable |
-            QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
-            QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges
+            QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
         )
         self.setAcceptHoverEvents(True)
 
@@ -71,6 +110,20 @@ class SignatureRectItem(QGraphicsRectItem):
         fill_color = QColor(0, 120, 212, 40)  # Semi-transparent blue
         self.setBrush(QBrush(fill_color))
 
+    def setRect(self, *args) -> None:
+        """Set the rectangle and drop the cached handle geometry."""
+        self._handles_path = None
+        super().setRect(*args)
+
+    def _get_handles_path(self) -> QPainterPath:
+        """Get a single path outlining all resize handles."""
+        if self._handles_path is None:
+            path = QPainterPath()
+            for rect in self._get_handle_rects().values():
+                path.addRect(rect)
+            self._handles_path = path
+        return self._handles_path
+
     def _get_handle_rects(self) -> dict[ResizeHandle, QRectF]:
         """Get rectangles for all resize handles."""
         rect = self.rect()
@@ -106,25 +159,43 @@ class SignatureRectItem(QGraphicsRectItem):
 
     def _get_handle_at(self, pos: QPointF) -> ResizeHandle:
         """Determine which handle (if any) is at the given position."""
-        for handle, rect in self._get_handle_rects().items():
-            if rect.contains(pos):
-                return handle
-        return ResizeHandle.NONE
+        rect = self.rect()
+        hhs = self.HANDLE_SIZE / 2
+        x = pos.x()
+        y = pos.y()
+        left, right = rect.left(), rect.right()
+        top, bottom = rect.top(), rect.bottom()
+
+        # Interior and exterior points, the common cases, touch no handle
+        if left + hhs < x < right - hhs and top + hhs < y < bottom - hhs:
+            return ResizeHandle.NONE
+        if x < left - hhs or x > right + hhs or y < top - hhs or y > bottom + hhs:
+            return ResizeHandle.NONE
+
+        # Corners are checked before edge midpoints
+        if abs(x - left) <= hhs:
+            column = 0
+        elif abs(x - right) <= hhs:
+            column = 2
+        elif abs(x - (left + right) / 2) <= hhs:
+            column = 1
+        else:
+            return ResizeHandle.NONE
+
+        if abs(y - top) <= hhs:
+            row = 0
+        elif abs(y - bottom) <= hhs:
+            row = 2
+        elif abs(y - (top + bottom) / 2) <= hhs:
+            row = 1
+        else:
+            return ResizeHandle.NONE
+
+        return _HANDLE_GRID[row][column]
 
     def _get_cursor_for_handle(self, handle: ResizeHandle) -> Qt.CursorShape:
         """Get the appropriate cursor for a resize handle."""
-        cursor_map = {
-            ResizeHandle.TOP_LEFT: Qt.CursorShape.SizeFDiagCursor,
-            ResizeHandle.BOTTOM_RIGHT: Qt.CursorShape.SizeFDiagCursor,
-            ResizeHandle.TOP_RIGHT: Qt.CursorShape.SizeBDiagCursor,
-            ResizeHandle.BOTTOM_LEFT: Qt.CursorShape.SizeBDiagCursor,
-            ResizeHandle.TOP: Qt.CursorShape.SizeVerCursor,
-            ResizeHandle.BOTTOM: Qt.CursorShape.SizeVerCursor,
-            ResizeHandle.LEFT: Qt.CursorShape.SizeHorCursor,
-            ResizeHandle.RIGHT: Qt.CursorShape.SizeHorCursor,
-            ResizeHandle.NONE: Qt.CursorShape.SizeAllCursor,
-        }
-        return cursor_map.get(handle, Qt.CursorShape.ArrowCursor)
+        return _HANDLE_CURSORS[handle & 0xF]
 
     def boundingRect(self) -> QRectF:
         """Return bounding rect including handles."""
@@ -144,11 +215,9 @@ class SignatureRectItem(QGraphicsRectItem):
 
         # Draw resize handles when selected
         if self.isSelected():
-            painter.setPen(QPen(QColor(0, 120, 212), 1))
-            painter.setBrush(QBrush(Qt.GlobalColor.white))
-
-            for handle, rect in self._get_handle_rects().items():
-                painter.drawRect(rect)
+            painter.setPen(self._handle_pen)
+            painter.setBrush(self._handle_brush)
+            painter.drawPath(self._get_handles_path())
 
     def hoverMoveEvent(self, event) -> None:
         """Update cursor based on position."""
@@ -179,7 +248,9 @@ class SignatureRectItem(QGraphicsRectItem):
     def mouseMoveEvent(self, event) -> None:
         """Handle mouse move for resize."""
         if self._current_handle != ResizeHandle.NONE and self._drag_start_rect:
-            self._resize_rect(event.pos())
+            self._pending_resize_pos = event.pos()
+            if not self._resize_timer.isActive():
+                self._resize_timer.start()
             event.accept()
             return
 
@@ -187,11 +258,20 @@ class SignatureRectItem(QGraphicsRectItem):
 
     def mouseReleaseEvent(self, event) -> None:
         """Handle mouse release."""
+        self._resize_timer.stop()
+        self._apply_pending_resize()
         self._current_handle = ResizeHandle.NONE
         self._drag_start_pos = None
         self._drag_start_rect = None
         super().mouseReleaseEvent(event)
 
+    def _apply_pending_resize(self) -> None:
+        """Resize to the most recent drag position, if one is pending."""
+        pos = self._pending_resize_pos
+        self._pending_resize_pos = None
+        if pos is not None and self._current_handle != ResizeHandle.NONE:
+            self._resize_rect(pos)
+
     def _resize_rect(self, current_pos: QPointF) -> None:
         """Resize the rectangle based on handle being dragged."""
         if not self._drag_start_rect or not self._drag_start_pos:
@@ -199,32 +279,25 @@ class SignatureRectItem(QGraphicsRectItem):
 
         rect = QRectF(self._drag_start_rect)
         delta = current_pos - self._drag_start_pos
+        handle = self._current_handle
 
-        # Apply resize based on handle
-        if self._current_handle in (
-            ResizeHandle.TOP_LEFT, ResizeHandle.TOP, ResizeHandle.TOP_RIGHT
-        ):
+        # Apply resize to each edge the handle moves
+        if handle & ResizeHandle.TOP:
             new_top = rect.top() + delta.y()
             if rect.bottom() - new_top >= self.MIN_HEIGHT:
                 rect.setTop(new_top)
 
-        if self._current_handle in (
-            ResizeHandle.BOTTOM_LEFT, ResizeHandle.BOTTOM, ResizeHandle.BOTTOM_RIGHT
-        ):
+        if handle & ResizeHandle.BOTTOM:
             new_bottom = rect.bottom() + delta.y()
             if new_bottom - rect.top() >= self.MIN_HEIGHT:
                 rect.setBottom(new_bottom)
 
-        if self._current_handle in (
-            ResizeHandle.TOP_LEFT, ResizeHandle.LEFT, ResizeHandle.BOTTOM_LEFT
-        ):
+        if handle & ResizeHandle.LEFT:
             new_left = rect.left() + delta.x()
             if rect.right() - new_left >= self.MIN_WIDTH:
                 rect.setLeft(new_left)
 
-        if self._current_handle in (
-            ResizeHandle.TOP_RIGHT, ResizeHandle.RIGHT, ResizeHandle.BOTTOM_RIGHT
-        ):
+        if handle & ResizeHandle.RIGHT:
             new_right = rect.right() + delta.x()
             if new_right - rect.left() >= self.MIN_WIDTH:
                 rect.setRight(new_right)
@@ -236,20 +309,11 @@ class SignatureRectItem(QGraphicsRectItem):
         rect = self.rect()
         pos = self.pos()
 
-        # Calculate absolute position
-        abs_rect = rect.translated(pos)
-
-        # Constrain to bounds
-        if abs_rect.left() < bounds.left():
-            pos.setX(bounds.left() - rect.left())
-        if abs_rect.right() > bounds.right():
-            pos.setX(bounds.right() - rect.right())
-        if abs_rect.top() < bounds.top():
-            pos.setY(bounds.top() - rect.top())
-        if abs_rect.bottom() > bounds.bottom():
-            pos.setY(bounds.bottom() - rect.bottom())
+        # Clamp the position; an oversized rect is aligned right/bottom
+        x = min(max(pos.x(), bounds.left() - rect.left()), bounds.right() - rect.right())
+        y = min(max(pos.y(), bounds.top() - rect.top()), bounds.bottom() - rect.bottom())
 
-        self.setPos(pos)
+        self.setPos(x, y)
 
     def get_scene_rect(self) -> QRectF:
         """Get the rectangle in scene coordinates."""
@@ -1,32 +1,39 @@
 """Coordinate conversion between Qt and PDF coordinate systems."""
 
-from dataclasses import dataclass
-from PySide6.QtCore import QRectF, QPointF
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    # Qt is imported lazily so headless callers never pay its startup cost
+    from PySide6.QtCore import QRectF, QPointF
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PDFRect:
     """Rectangle in PDF coordinates (origin bottom-left, Y up)."""
     x1: float  # Left
     y1: float  # Bottom
     x2: float  # Right
     y2: float  # Top
-
-    @property
-    def width(self) -> float:
-        return self.x2 - self.x1
-
-    @property
-    def height(self) -> float:
-        return self.y2 - self.y1
+    # Derived once, since the rect is immutable
+    width: float = field(init=False, repr=False, compare=False)
+    height: float = field(init=False, repr=False, compare=False)
+    _tuple: tuple[float, float, float, float] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "width", self.x2 - self.x1)
+        object.__setattr__(self, "height", self.y2 - self.y1)
+        object.__setattr__(self, "_tuple", (self.x1, self.y1, self.x2, self.y2))
 
     def as_tuple(self) -> tuple[float, float, float, float]:
         """Return as (x1, y1, x2, y2) tuple."""
-        return (self.x1, self.y1, self.x2, self.y2)
+        return self._tuple
 
 
 def qt_to_pdf_rect(
-    qt_rect: QRectF,
+    qt_rect: "QRectF",
     page_height: float,
     zoom: float = 1.0
 ) -> PDFRect:
@@ -66,7 +73,7 @@ def pdf_to_qt_rect(
     pdf_rect: PDFRect,
     page_height: float,
     zoom: float = 1.0
-) -> QRectF:
+) -> "QRectF":
     """
     Convert a PDF rectangle to Qt coordinates.
 
@@ -78,6 +85,8 @@ def pdf_to_qt_rect(
     Returns:
         QRectF in Qt coordinate system.
     """
+    from PySide6.QtCore import QRectF
+
     # Apply zoom and invert Y axis
     left = pdf_rect.x1 * zoom
     right = pdf_rect.x2 * zoom
@@ -91,7 +100,7 @@ def pdf_to_qt_rect(
 
 
 def qt_point_to_pdf(
-    point: QPointF,
+    point: "QPointF",
     page_height: float,
     zoom: float = 1.0
 ) -> tuple[float, float]:
@@ -111,6 +120,18 @@ def qt_point_to_pdf(
     return (x, y)
 
 
+# Corner mapping (x1, y1, x2, y2, page_width, page_height) -> (x1, y1, x2, y2)
+# for each page rotation; 0 degrees needs no adjustment
+_ROTATIONS = {
+    # Rotate 90 degrees clockwise
+    90: lambda x1, y1, x2, y2, w, h: (y1, w - x2, y2, w - x1),
+    # Rotate 180 degrees
+    180: lambda x1, y1, x2, y2, w, h: (w - x2, h - y2, w - x1, h - y1),
+    # Rotate 270 degrees clockwise (90 counter-clockwise)
+    270: lambda x1, y1, x2, y2, w, h: (h - y2, x1, h - y1, x2),
+}
+
+
 def adjust_rect_for_rotation(
     pdf_rect: PDFRect,
     page_width: float,
@@ -129,34 +150,10 @@ def adjust_rect_for_rotation(
     Returns:
         Adjusted PDFRect accounting for rotation.
     """
-    if rotation == 0:
+    transform = _ROTATIONS.get(rotation)
+    if transform is None:
         return pdf_rect
 
-    x1, y1, x2, y2 = pdf_rect.x1, pdf_rect.y1, pdf_rect.x2, pdf_rect.y2
-
-    if rotation == 90:
-        # Rotate 90 degrees clockwise
-        return PDFRect(
-            x1=y1,
-            y1=page_width - x2,
-            x2=y2,
-            y2=page_width - x1
-        )
-    elif rotation == 180:
-        # Rotate 180 degrees
-        return PDFRect(
-            x1=page_width - x2,
-            y1=page_height - y2,
-            x2=page_width - x1,
-            y2=page_height - y1
-        )
-    elif rotation == 270:
-        # Rotate 270 degrees clockwise (90 counter-clockwise)
-        return PDFRect(
-            x1=page_height - y2,
-            y1=x1,
-            x2=page_height - y1,
-            y2=x2
-        )
-
-    return pdf_rect
+    return PDFRect(*transform(
+        pdf_rect.x1, pdf_rect.y1, pdf_rect.x2, pdf_rect.y2, page_width, page_height
+    ))
@@ -1,12 +1,13 @@
 """Platform detection and PKCS#11 library path discovery."""
 
+import functools
 import os
 import platform
 from pathlib import Path
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class PKCS11LibraryInfo:
     """Information about a PKCS#11 library."""
     path: Path
@@ -46,6 +47,11 @@ LUXTRUST_PATHS = {
 }
 
 
+# Candidate paths for the platform this process runs on
+_CURRENT_OS_PATHS: tuple[Path, ...] = tuple(LUXTRUST_PATHS.get(platform.system(), []))
+
+
+@functools.cache
 def get_current_os() -> str:
     """Get the current operating system name."""
     return platform.system()
@@ -55,13 +61,17 @@ def discover_pkcs11_library() -> Path | None:
     """
     Discover the PKCS#11 library for the current platform.
 
+    The PDFSIGN_PKCS11_LIB environment variable, when it names an existing
+    file, takes precedence over the known install locations.
+
     Returns:
         Path to the library if found, None otherwise.
     """
-    current_os = get_current_os()
-    paths = LUXTRUST_PATHS.get(current_os, [])
+    env_path = os.environ.get("PDFSIGN_PKCS11_LIB")
+    if env_path and Path(env_path).exists():
+        return Path(env_path)
 
-    for path in paths:
+    for path in _CURRENT_OS_PATHS:
         if path.exists():
             return path
 
@@ -75,16 +85,13 @@ def get_all_pkcs11_candidates() -> list[PKCS11LibraryInfo]:
     Returns:
         List of PKCS11LibraryInfo with existence status.
     """
-    current_os = get_current_os()
-    paths = LUXTRUST_PATHS.get(current_os, [])
-
     return [
         PKCS11LibraryInfo(
             path=p,
             name=p.name,
             exists=p.exists()
         )
-        for p in paths
+        for p in _CURRENT_OS_PATHS
     ]
 
 
@@ -1,15 +1,28 @@
 """Settings persistence for PDF Signer application."""
 
+import atexit
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 
 from pdfsign.core.signature_manager import SignatureAppearance, SignatureAppearanceType
+from pdfsign.utils.coordinates import PDFRect
 
 logger = logging.getLogger(__name__)
 
 CONFIG_DIR_NAME = "pdfsign-luxtrust"
 SETTINGS_FILENAME = "settings.json"
+# Saves within this window are merged into a single write
+SETTINGS_FLUSH_DELAY_SECONDS = 0.2
+
+# Saved values not yet written to disk, guarded by _pending_lock
+_pending: dict = {}
+_pending_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+# Parsed settings file, keyed by the (mtime_ns, size) it was read at
+_settings_cache: tuple[tuple[int, int], dict] | None = None
 
 
 def get_config_dir() -> Path:
@@ -25,26 +38,84 @@ def get_settings_file() -> Path:
 
 
 def _load_settings() -> dict:
-    """Load all settings from the settings file."""
+    """Load all settings, including saves not yet flushed to disk."""
+    settings = _read_settings_file()
+    with _pending_lock:
+        settings.update(_pending)
+    return settings
+
+
+def _read_settings_file() -> dict:
+    """Load all settings from the settings file, reparsing only when it changed."""
+    global _settings_cache
     settings_file = get_settings_file()
-    if not settings_file.exists():
+    try:
+        stat = settings_file.stat()
+    except FileNotFoundError:
         return {}
+
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if _settings_cache is not None and _settings_cache[0] == stamp:
+        return dict(_settings_cache[1])
+
     try:
         with open(settings_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            settings = json.load(f)
     except (json.JSONDecodeError, IOError) as e:
         logger.warning("Failed to load settings: %s", e)
         return {}
 
+    _settings_cache = (stamp, settings)
+    return dict(settings)
 
-def _save_settings(data: dict) -> None:
-    """Merge data into existing settings and save."""
-    existing = _load_settings()
-    existing.update(data)
 
-    settings_file = get_settings_file()
-    with open(settings_file, "w", encoding="utf-8") as f:
-        json.dump(existing, f, indent=2, ensure_ascii=False)
+def _save_settings(data: dict) -> None:
+    """Merge data into the settings and schedule a write."""
+    global _flush_timer
+    with _pending_lock:
+        _pending.update(data)
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(SETTINGS_FLUSH_DELAY_SECONDS, flush_settings)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def flush_settings() -> None:
+    """Write pending settings to the settings file now."""
+    global _flush_timer, _settings_cache
+    with _pending_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if not _pending:
+            return
+
+        existing = _read_settings_file()
+        existing.update(_pending)
+
+        settings_file = get_settings_file()
+        # Write a sibling file and swap it in, so a crash never leaves a truncated file
+        tmp_file = settings_file.with_name(settings_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(existing, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, settings_file)
+        except OSError as e:
+            # Keep the values pending so the next flush retries them
+            logger.warning("Failed to save settings: %s", e)
+            return
+        _pending.clear()
+
+        # What was just written is the file's content; no need to parse it back
+        stat = settings_file.stat()
+        _settings_cache = ((stat.st_mtime_ns, stat.st_size), existing)
+
+
+# Don't lose saves still waiting on the timer when the app exits
+atexit.register(flush_settings)
 
 
 def save_signature_appearance(appearance: SignatureAppearance) -> None:
@@ -95,6 +166,20 @@ def load_signature_appearance() -> SignatureAppearance | None:
     )
 
 
+def save_signature_position(pdf_rect: PDFRect) -> None:
+    """Save the last signature rectangle, in PDF coordinates."""
+    _save_settings({"signature_position": list(pdf_rect.as_tuple())})
+
+
+def load_signature_position() -> PDFRect | None:
+    """Load the last signature rectangle, in PDF coordinates."""
+    position = _load_settings().get("signature_position")
+    try:
+        return PDFRect(*(float(v) for v in position))
+    except (TypeError, ValueError):
+        return None
+
+
 def save_pkcs11_library(lib_path: str) -> None:
     """Save the PKCS#11 library path."""
     _save_settings({"pkcs11_library": lib_path})
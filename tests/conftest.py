@@ -0,0 +1,30 @@
+"""Shared fixtures for the test suite."""
+
+import os
+
+import pymupdf
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The QApplication, created once and shown on no screen."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Build a PDF with one page per (width, height) and return its path."""
+    def make(*sizes, name="sample.pdf"):
+        path = tmp_path / name
+        doc = pymupdf.open()
+        for n, (width, height) in enumerate(sizes):
+            page = doc.new_page(width=width, height=height)
+            page.insert_text((36, 36), f"Page {n + 1}")
+        doc.save(path)
+        doc.close()
+        return path
+
+    return make
@@ -0,0 +1,52 @@
+"""Tests for Qt/PDF coordinate conversion."""
+
+import dataclasses
+
+import pytest
+
+from pdfsign.utils.coordinates import (
+    PDFRect,
+    adjust_rect_for_rotation,
+    pdf_to_qt_rect,
+    qt_to_pdf_rect,
+)
+
+
+def test_pdf_rect_is_frozen_with_derived_sizes():
+    rect = PDFRect(10, 20, 110, 70)
+
+    assert (rect.width, rect.height) == (100, 50)
+    assert rect.as_tuple() == (10, 20, 110, 70)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        rect.x1 = 0
+
+
+def test_pdf_rect_equality_ignores_derived_fields():
+    assert PDFRect(1, 2, 3, 4) == PDFRect(1.0, 2.0, 3.0, 4.0)
+    assert hash(PDFRect(1, 2, 3, 4)) == hash(PDFRect(1.0, 2.0, 3.0, 4.0))
+    assert repr(PDFRect(1, 2, 3, 4)) == "PDFRect(x1=1, y1=2, x2=3, y2=4)"
+
+
+# Page 600 x 800, rect 10..110 horizontally and 20..70 vertically
+@pytest.mark.parametrize("rotation, expected", [
+    (0, (10, 20, 110, 70)),
+    (90, (20, 490, 70, 590)),
+    (180, (490, 730, 590, 780)),
+    (270, (730, 10, 780, 110)),
+    (45, (10, 20, 110, 70)),
+])
+def test_adjust_rect_for_rotation(rotation, expected):
+    rect = adjust_rect_for_rotation(PDFRect(10, 20, 110, 70), 600, 800, rotation)
+
+    assert rect.as_tuple() == expected
+
+
+def test_qt_pdf_round_trip():
+    pytest.importorskip("PySide6.QtCore")
+    pdf_rect = PDFRect(10, 20, 110, 70)
+
+    qt_rect = pdf_to_qt_rect(pdf_rect, 800, zoom=1.5)
+
+    assert (qt_rect.left(), qt_rect.top()) == (15, 1095)
+    assert (qt_rect.width(), qt_rect.height()) == (150, 75)
+    assert qt_to_pdf_rect(qt_rect, 800, zoom=1.5) == pdf_rect
@@ -0,0 +1,46 @@
+"""Tests for the shared Java signer registry."""
+
+import pytest
+
+from pdfsign.crypto import java_signer
+from pdfsign.crypto.java_signer import close_shared_signers, get_shared_signer
+
+
+@pytest.fixture
+def pkcs11_lib(tmp_path, monkeypatch):
+    """A fake JAR, Java and PKCS#11 library; no JVM is ever started."""
+    java_home = tmp_path / "jdk"
+    (java_home / "bin").mkdir(parents=True)
+    (java_home / "bin" / "java").touch()
+    jar = tmp_path / "signer.jar"
+    jar.touch()
+    lib = tmp_path / "libgclib.so"
+    lib.touch()
+    monkeypatch.setenv("PDFSIGN_JAVA_HOME", str(java_home))
+    monkeypatch.setenv("PDFSIGN_JAR_PATH", str(jar))
+    monkeypatch.setenv("PDFSIGN_PKCS11_LIB", str(lib))
+    monkeypatch.setattr(java_signer, "_shared_signers", {})
+    return lib
+
+
+def test_shared_signer_is_keyed_by_resolved_library(pkcs11_lib, tmp_path):
+    link = tmp_path / "link.so"
+    link.symlink_to(pkcs11_lib)
+
+    signer = get_shared_signer(str(pkcs11_lib))
+
+    assert get_shared_signer(str(link)) is signer
+    # Auto-detection finds the same library through PDFSIGN_PKCS11_LIB
+    assert get_shared_signer() is signer
+    assert signer.pkcs11_lib == str(pkcs11_lib.resolve())
+
+
+def test_close_shared_signers(pkcs11_lib, monkeypatch):
+    signer = get_shared_signer(str(pkcs11_lib))
+    closed = []
+    monkeypatch.setattr(signer, "close", lambda: closed.append(signer))
+
+    close_shared_signers()
+
+    assert closed == [signer]
+    assert get_shared_signer(str(pkcs11_lib)) is not signer
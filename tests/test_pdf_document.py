@@ -0,0 +1,77 @@
+"""Tests for PDFDocument against real PyMuPDF."""
+
+import pymupdf
+import pytest
+
+from pdfsign.core.pdf_document import PDFDocument
+
+
+@pytest.fixture
+def pdf_path(make_pdf):
+    """A two-page A4 PDF with some text on each page."""
+    return make_pdf((595, 842), (595, 842))
+
+
+def test_render_page_to_bytes(pdf_path):
+    with PDFDocument() as document:
+        document.open(pdf_path)
+        data = document.render_page_to_bytes(0)
+
+    assert data.startswith(b"\x89PNG")
+
+
+def test_render_page_to_bytes_trims_store(pdf_path, monkeypatch):
+    shrinks = []
+    monkeypatch.setattr(pymupdf.TOOLS, "store_shrink", shrinks.append)
+
+    with PDFDocument() as document:
+        document.open(pdf_path)
+        for zoom in range(1, PDFDocument.STORE_TRIM_INTERVAL + 2):
+            document.render_page_to_bytes(0, zoom=zoom / 10)
+
+        assert len(shrinks) == 1
+        # Cached renders do not count towards the next trim
+        for _ in range(PDFDocument.STORE_TRIM_INTERVAL):
+            document.render_page_to_bytes(0, zoom=0.1)
+        assert len(shrinks) == 1
+
+
+def test_render_page_is_cached(pdf_path, qapp):
+    with PDFDocument() as document:
+        document.open(pdf_path)
+        assert not document.is_rendered(1)
+
+        pixmap = document.render_page(1)
+
+        assert not pixmap.isNull()
+        assert document.is_rendered(1)
+        assert document.render_page(1) is pixmap
+
+
+def test_render_pages_to_bytes_uses_cache(pdf_path):
+    with PDFDocument() as document:
+        document.open(pdf_path)
+        first = document.render_pages_to_bytes([0, 1])
+        second = document.render_pages_to_bytes([1, 0])
+
+    assert second == [first[1], first[0]]
+    assert second[0] is first[1]
+
+
+@pytest.mark.parametrize("max_bytes, from_stream", [(1 << 20, True), (0, False)])
+def test_open_reads_only_small_files_into_memory(pdf_path, monkeypatch, max_bytes, from_stream):
+    calls = []
+    real_open = pymupdf.open
+
+    def open_spy(*args, **kwargs):
+        calls.append(kwargs)
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(pymupdf, "open", open_spy)
+    monkeypatch.setattr(PDFDocument, "IN_MEMORY_OPEN_MAX_BYTES", max_bytes)
+
+    with PDFDocument() as document:
+        document.open(pdf_path)
+        assert document.page_count == 2
+
+    assert ("stream" in calls[0]) == from_stream
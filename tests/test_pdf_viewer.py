@@ -0,0 +1,95 @@
+"""Tests for PDFViewer signature placement."""
+
+import pytest
+
+from pdfsign.core.pdf_document import PDFDocument
+from pdfsign.utils.coordinates import PDFRect
+
+
+@pytest.fixture
+def viewer(qapp):
+    from pdfsign.ui.pdf_viewer import PDFViewer
+
+    viewer = PDFViewer()
+    yield viewer
+    viewer.clear_document()
+    viewer.deleteLater()
+
+
+@pytest.fixture
+def small_document(make_pdf):
+    """An A6 portrait page, smaller than the A4 landscape positions saved below."""
+    with PDFDocument() as document:
+        document.open(make_pdf((298, 420)))
+        yield document
+
+
+def _inside(rect, page_width, page_height):
+    return 0 <= rect.x1 <= rect.x2 <= page_width and 0 <= rect.y1 <= rect.y2 <= page_height
+
+
+def test_restored_position_is_moved_onto_smaller_page(viewer, small_document):
+    viewer.set_document(small_document)
+    # Bottom-right corner of an A4 landscape page, off the A6 page
+    viewer.remember_signature_position(PDFRect(600, 40, 800, 120))
+
+    viewer.show_signature_rect()
+
+    position = viewer.get_signature_position()
+    assert _inside(position, 298, 420)
+    assert position.width == pytest.approx(200)
+    assert position.height == pytest.approx(80)
+
+
+def test_restored_position_too_large_uses_default(viewer, small_document):
+    viewer.set_document(small_document)
+    viewer.remember_signature_position(PDFRect(0, 0, 500, 100))
+
+    viewer.show_signature_rect()
+
+    position = viewer.get_signature_position()
+    assert _inside(position, 298, 420)
+    assert position == PDFRect(48, 50, 248, 130)
+
+
+def test_restored_position_on_page_is_kept(viewer, small_document):
+    viewer.set_document(small_document)
+    saved = PDFRect(20, 30, 220, 110)
+    viewer.remember_signature_position(saved)
+
+    viewer.show_signature_rect()
+
+    position = viewer.get_signature_position()
+    assert position.as_tuple() == pytest.approx(saved.as_tuple())
+
+
+@pytest.mark.parametrize("zoom, expected", [(1.049, 1.0), (0.999, 0.95), (0.35, 0.35), (0.1, 0.25)])
+def test_snap_fit_zoom_rounds_down(viewer, zoom, expected):
+    assert viewer._snap_fit_zoom(zoom) == pytest.approx(expected)
+
+
+def _drag(viewer, start, end):
+    from PySide6.QtCore import Qt
+    from PySide6.QtTest import QTest
+
+    viewport = viewer.viewport()
+    QTest.mousePress(viewport, Qt.MouseButton.LeftButton, pos=start)
+    if end != start:
+        QTest.mouseMove(viewport, end)
+    QTest.mouseRelease(viewport, Qt.MouseButton.LeftButton, pos=end)
+
+
+def test_signature_position_changed_only_after_a_move(viewer, small_document):
+    viewer.resize(600, 800)
+    viewer.show()
+    viewer.set_document(small_document)
+    viewer.show_signature_rect()
+    emitted = []
+    viewer.signature_position_changed.connect(emitted.append)
+    center = viewer.mapFromScene(viewer._signature_rect.get_scene_rect().center())
+
+    _drag(viewer, center, center)
+    assert emitted == []
+
+    _drag(viewer, center, center - center / 4)
+    assert emitted == [viewer.get_signature_position()]
@@ -0,0 +1,77 @@
+"""Tests for debounced, atomic settings persistence."""
+
+import json
+import os
+
+import pytest
+
+from pdfsign.utils import settings
+from pdfsign.utils.coordinates import PDFRect
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Point the settings at a temporary home and start with nothing pending."""
+    monkeypatch.setattr(settings.Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(settings, "_pending", {})
+    monkeypatch.setattr(settings, "_flush_timer", None)
+    monkeypatch.setattr(settings, "_settings_cache", None)
+    # Long enough that only an explicit flush_settings() writes during a test
+    monkeypatch.setattr(settings, "SETTINGS_FLUSH_DELAY_SECONDS", 60)
+    yield settings.get_settings_file()
+    if settings._flush_timer is not None:
+        settings._flush_timer.cancel()
+
+
+def test_saves_are_merged_into_one_write(settings_file, monkeypatch):
+    writes = []
+    real_replace = os.replace
+    monkeypatch.setattr(settings.os, "replace", lambda *a: writes.append(a) or real_replace(*a))
+
+    settings.save_pkcs11_library("/usr/lib/libgclib.so")
+    settings.save_signature_position(PDFRect(10, 20, 210, 100))
+
+    assert not settings_file.exists()
+    # Pending saves are visible before they reach the disk
+    assert settings.load_pkcs11_library() == "/usr/lib/libgclib.so"
+
+    settings.flush_settings()
+
+    assert len(writes) == 1
+    assert json.loads(settings_file.read_text()) == {
+        "pkcs11_library": "/usr/lib/libgclib.so",
+        "signature_position": [10, 20, 210, 100],
+    }
+
+
+def test_failed_write_keeps_old_file_and_retries(settings_file, monkeypatch):
+    settings.save_pkcs11_library("/old.so")
+    settings.flush_settings()
+
+    real_replace = os.replace
+    failures = [OSError("disk full")]
+
+    def replace(*args):
+        if failures:
+            raise failures.pop()
+        real_replace(*args)
+
+    monkeypatch.setattr(settings.os, "replace", replace)
+    settings.save_pkcs11_library("/new.so")
+    settings.flush_settings()
+
+    assert json.loads(settings_file.read_text()) == {"pkcs11_library": "/old.so"}
+
+    settings.flush_settings()
+
+    assert json.loads(settings_file.read_text()) == {"pkcs11_library": "/new.so"}
+
+
+def test_external_edit_is_picked_up(settings_file):
+    settings.save_pkcs11_library("/a.so")
+    settings.flush_settings()
+    assert settings.load_pkcs11_library() == "/a.so"
+
+    settings_file.write_text(json.dumps({"pkcs11_library": "/edited.so"}))
+
+    assert settings.load_pkcs11_library() == "/edited.so"
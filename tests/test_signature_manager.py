@@ -0,0 +1,36 @@
+"""Tests for SignatureManager helpers that do not need a token."""
+
+import pymupdf
+import pytest
+
+from pdfsign.core.signature_manager import SignatureManager
+
+
+@pytest.fixture
+def form_pdf(tmp_path, monkeypatch):
+    """A PDF whose text field already uses the name "Signature2"."""
+    monkeypatch.setattr(SignatureManager, "_field_counters", {})
+    path = tmp_path / "form.pdf"
+    doc = pymupdf.open()
+    page = doc.new_page()
+    widget = pymupdf.Widget()
+    widget.field_type = pymupdf.PDF_WIDGET_TYPE_TEXT
+    widget.field_name = "Signature2"
+    widget.rect = pymupdf.Rect(50, 50, 200, 80)
+    page.add_widget(widget)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_unique_field_name_skips_names_of_any_field_type(form_pdf):
+    assert SignatureManager.generate_unique_field_name(form_pdf) == "Signature3"
+    assert SignatureManager.generate_unique_field_name(form_pdf) == "Signature4"
+
+
+def test_unique_field_name_keeps_one_counter_per_file(form_pdf):
+    SignatureManager.generate_unique_field_name(form_pdf)
+    form_pdf.write_bytes(form_pdf.read_bytes() + b"\n")
+
+    assert SignatureManager.generate_unique_field_name(form_pdf) == "Signature3"
+    assert list(SignatureManager._field_counters) == [form_pdf.resolve()]
@@ -0,0 +1,43 @@
+"""Tests for the signature rectangle's resize handles."""
+
+import pytest
+
+from pdfsign.ui.signature_rect import ResizeHandle
+
+
+@pytest.fixture
+def item(qapp):
+    from pdfsign.ui.signature_rect import SignatureRectItem
+
+    return SignatureRectItem(10, 20, 200, 80)
+
+
+@pytest.mark.parametrize("x, y, handle", [
+    (10, 20, ResizeHandle.TOP_LEFT),
+    (210, 100, ResizeHandle.BOTTOM_RIGHT),
+    (110, 20, ResizeHandle.TOP),
+    (210, 60, ResizeHandle.RIGHT),
+    (13, 97, ResizeHandle.BOTTOM_LEFT),
+    (110, 60, ResizeHandle.NONE),
+    (60, 20, ResizeHandle.NONE),
+    (300, 300, ResizeHandle.NONE),
+])
+def test_handle_at(item, x, y, handle):
+    from PySide6.QtCore import QPointF
+
+    assert item._get_handle_at(QPointF(x, y)) == handle
+
+
+def test_handle_at_matches_handle_rects(item):
+    """The arithmetic hit-test agrees with the drawn handle rectangles."""
+    from PySide6.QtCore import QPointF
+
+    handle_rects = item._get_handle_rects()
+    for x2 in range(0, 2 * 230):
+        for y2 in range(2 * 10, 2 * 110):
+            pos = QPointF(x2 / 2, y2 / 2)
+            expected = next(
+                (handle for handle, rect in handle_rects.items() if rect.contains(pos)),
+                ResizeHandle.NONE,
+            )
+            assert item._get_handle_at(pos) == expected, (pos.x(), pos.y())